@@ -0,0 +1,162 @@
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Literal
+
+import uvicorn
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import BaseModel, Field, field_validator
+
+import warmup
+from breaker import breakers
+from catalog import catalog
+from deadline import MATCH_DEADLINE, Deadline
+from jobs import jobs
+from negative import negative_cache
+from pipeline import api, token
+from ratelimit import RateLimitExceeded, model_limiter, whatsapp_limiter
+from workers import JobPool
+
+# Application logs (cacheable prompt prefix, profile paths, warm-up) at
+# LOG_LEVEL; DEBUG adds the query planner's explain output
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+# One INFO line per HTTP request otherwise
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+class MatchRequest(BaseModel):
+    name: str = Field(min_length=1)
+    age: int = Field(ge=18, le=100)
+    gender: Literal["Male", "Female"]
+    profession: str = Field(min_length=1)
+    education: str = Field(min_length=1)
+    location: str = Field(min_length=1)
+    number: str
+    custom_prompt: str = ""
+
+    @field_validator("number")
+    @classmethod
+    def whatsapp_number(cls, number):
+        number = number.replace(" ", "").replace("-", "").lstrip("+")
+        if len(number) > 18 or not number.isdigit():
+            raise ValueError("Enter a valid WhatsApp number.")
+        return number
+
+
+# Per-worker state: the pipeline's clients and agent are module globals of
+# `pipeline`, shared by every request this worker serves; the warm-up builds
+# the indexes and opens their connections before the worker reports ready,
+# then starts the worker's job pool
+pool = JobPool()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    await warmup.warm_up()
+    await pool.start()
+    yield
+    warmup.ready = False
+    await pool.stop()
+
+
+app = FastAPI(title="Rishta Bot", lifespan=lifespan)
+
+
+# Jobs are queued for the worker's pool. With `wait`, `timeout` is what is
+# left of the caller's own budget, in seconds: the job's deadline starts now
+# and never exceeds MATCH_DEADLINE. Without it the job gets its full
+# deadline when a pool worker starts it.
+@app.post("/match", status_code=202)
+async def submit_match(request: MatchRequest, wait: bool = False, timeout: float | None = None):
+    deadline = None
+    if wait:
+        deadline = Deadline(MATCH_DEADLINE if timeout is None else min(timeout, MATCH_DEADLINE))
+    try:
+        job_id = pool.submit(request.model_dump(), deadline)
+    except RateLimitExceeded as e:
+        raise HTTPException(429, str(e))
+    if not wait:
+        return {"job_id": job_id, "status": "queued"}
+
+    await pool.wait(job_id)
+    job = jobs.get(job_id)
+    if job["status"] == "rejected":
+        raise HTTPException(429, job["error"])
+    if job["status"] == "timeout":
+        raise HTTPException(504, job["error"])
+    if job["status"] == "failed":
+        raise HTTPException(502, job["error"])
+    return JSONResponse(job)
+
+
+@app.get("/match/{job_id}")
+async def match_status(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(404, "Unknown job")
+    return job
+
+
+@app.get("/healthz")
+async def healthz():
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readyz():
+    if not warmup.ready or not api or not token:
+        raise HTTPException(503, "Not ready")
+    return {"status": "ready", "profiles": len(catalog.profiles), "warmup": warmup.report}
+
+
+@app.get("/status")
+async def status():
+    return {"breakers": [b.snapshot() for b in breakers]}
+
+
+STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    lines = [
+        "# TYPE rishta_breaker_state gauge",
+        "# TYPE rishta_breaker_calls gauge",
+        "# TYPE rishta_breaker_error_rate gauge",
+        "# TYPE rishta_breaker_slow_rate gauge",
+        "# TYPE rishta_breaker_p95_seconds gauge",
+        "# TYPE rishta_breaker_rejected_total counter",
+    ]
+    for b in breakers:
+        snap = b.snapshot()
+        label = f'{{service="{snap["name"]}"}}'
+        lines.append(f"rishta_breaker_state{label} {STATE_VALUES[snap['state']]}")
+        lines.append(f"rishta_breaker_calls{label} {snap['calls']}")
+        lines.append(f"rishta_breaker_error_rate{label} {snap['error_rate']}")
+        lines.append(f"rishta_breaker_slow_rate{label} {snap['slow_rate']}")
+        if snap["p95_seconds"] is not None:
+            lines.append(f"rishta_breaker_p95_seconds{label} {snap['p95_seconds']}")
+        lines.append(f"rishta_breaker_rejected_total{label} {snap['rejected']}")
+    lines.append("# TYPE rishta_limiter_waiters gauge")
+    for limiter in (model_limiter, whatsapp_limiter):
+        lines.append(f'rishta_limiter_waiters{{service="{limiter.name}"}} {limiter.waiters}')
+    lines.append("# TYPE rishta_jobs_queued gauge")
+    lines.append(f"rishta_jobs_queued {pool.queued}")
+    lines.append("# TYPE rishta_negative_cache_entries gauge")
+    lines.append(f"rishta_negative_cache_entries {len(negative_cache)}")
+    lines.append("# TYPE rishta_negative_cache_hits_total counter")
+    lines.append(f"rishta_negative_cache_hits_total {negative_cache.hits}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "api:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        workers=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+    )
@@ -0,0 +1,57 @@
+import argparse
+import gc
+import tracemalloc
+
+from data import rishtas
+from profiles import Profile
+
+
+# Loaders (CSV, JSON, Arrow) hand back a fresh string object per cell, unlike
+# the literals in data.py which the compiler already shares; copy every value
+# so both layouts start from the same un-shared input.
+def _fresh(value):
+    return "".join(list(value)) if isinstance(value, str) else value
+
+
+def _rows(n):
+    for i in range(n):
+        r = rishtas[i % len(rishtas)]
+        row = {k: _fresh(v) for k, v in r.items()}
+        row["id"] = i + 1
+        row["name"] = f"{r['name']} {i}"
+        yield row
+
+
+def measure(build, n):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = build(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return after - before
+
+
+def build_dicts(n):
+    return list(_rows(n))
+
+
+def build_profiles(n):
+    return [Profile.from_dict(r) for r in _rows(n)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Memory of dict vs Profile records, scaled to one million profiles"
+    )
+    parser.add_argument("-n", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    dicts = measure(build_dicts, args.n)
+    compact = measure(build_profiles, args.n)
+    scale = 1_000_000 / args.n
+    print(f"profiles measured: {args.n:,}")
+    print(f"dict records:    {dicts * scale / 2**20:8.1f} MiB per million ({dicts / args.n:.0f} B each)")
+    print(f"Profile records: {compact * scale / 2**20:8.1f} MiB per million ({compact / args.n:.0f} B each)")
+    print(f"saving:          {1 - compact / dicts:8.1%}")
@@ -0,0 +1,164 @@
+import copy
+
+import numpy as np
+
+# Categorical fields with one bitmap per distinct value; ages get one bitmap
+# per year, and an age band is the OR of its years
+FIELDS = ("gender", "location", "profession", "education", "age")
+
+
+def _pack(mask):
+    packed = np.packbits(mask, bitorder="little")
+    return np.pad(packed, (0, -len(packed) % 8)).view(np.uint64)
+
+
+# Bitsets over catalog positions (bit i = profiles[i]), packed 64 per word.
+# Filters combine them with AND/OR, counts are popcounts, and only the rows
+# that are finally needed get materialized. `columns` (from an Arrow file,
+# see dataset.columns_from) supplies ready-made value codes per field.
+# `position` maps ids to positions; the catalog passes its own, along with
+# its profile list, so the index keeps no second copy of either. Positions
+# past `n` (profiles added after this index was made) are not in it.
+class BitmapIndex:
+    def __init__(self, profiles, columns=None, position=None):
+        if position is None:
+            profiles = list(profiles)
+            position = {p.id: i for i, p in enumerate(profiles)}
+        self.profiles = profiles
+        self.n = len(self.profiles)
+        self._position = position
+        self.bitmaps = {}
+        self._values = {}
+        for field in FIELDS:
+            if columns is not None:
+                values, codes = columns[field]
+            else:
+                values, codes = np.unique(
+                    [str(getattr(p, field)).lower() for p in self.profiles], return_inverse=True
+                )
+                values = values.tolist()
+            self._values[field] = values
+            for code, value in enumerate(self._values[field]):
+                self.bitmaps[field, value] = _pack(codes == code)
+        # Rows per value, the statistics the query planner estimates from
+        self.counts = {key: self.count(bits) for key, bits in self.bitmaps.items()}
+        self.all = _pack(np.ones(self.n, dtype=bool))
+        self.none = np.zeros_like(self.all)
+
+    def values(self, field):
+        return self._values[field]
+
+    def bitmap(self, field, value):
+        return self.bitmaps.get((field, str(value).strip().lower()), self.none)
+
+    # OR of the bitmaps of `values`
+    def any_of(self, field, values):
+        bits = self.none.copy()
+        for value in values:
+            bits |= self.bitmap(field, value)
+        return bits
+
+    # OR of every value of `field` that contains `text` (case-insensitive)
+    def containing(self, field, text):
+        text = text.strip().lower()
+        return self.any_of(field, [v for v in self.values(field) if text in v])
+
+    def age_band(self, min_age, max_age):
+        return self.any_of("age", range(max(min_age, 0), max_age + 1))
+
+    def ids(self, ids):
+        mask = np.zeros(self.n, dtype=bool)
+        positions = (self._position.get(i) for i in ids)
+        mask[[i for i in positions if i is not None and i < self.n]] = True
+        return _pack(mask)
+
+    # Conjunction over fields, disjunction over the values given for one
+    # field; None leaves a field unconstrained
+    def match(
+        self,
+        gender=None,
+        min_age=None,
+        max_age=None,
+        locations=None,
+        professions=None,
+        educations=None,
+        exclude=(),
+    ):
+        bits = self.all.copy()
+        if gender is not None:
+            bits &= self.bitmap("gender", gender)
+        if min_age is not None or max_age is not None:
+            bits &= self.age_band(min_age or 0, max_age if max_age is not None else 200)
+        if locations:
+            bits &= self.any_of("location", locations)
+        if professions:
+            bits &= self.any_of("profession", professions)
+        if educations:
+            bits &= self.any_of("education", educations)
+        if exclude:
+            bits &= ~self.ids(exclude)
+        return bits
+
+    @staticmethod
+    def count(bits):
+        return int(np.bitwise_count(bits).sum())
+
+    def positions(self, bits):
+        return np.flatnonzero(np.unpackbits(bits.view(np.uint8), bitorder="little")[: self.n])
+
+    def rows(self, bits, offset=0, limit=None):
+        positions = self.positions(bits)
+        end = None if limit is None else offset + limit
+        return [self.profiles[i] for i in positions[offset:end]]
+
+
+    # A copy with position `i` changed from `old` to `new`, or `new` appended
+    # when `old` is None, for single-profile catalog edits. Only the bitmaps
+    # whose bit flips are copied (all of them when the bitsets need another
+    # word), so readers holding this index never see a half-made change.
+    def changed(self, i, old, new):
+        index = copy.copy(self)
+        index.bitmaps = dict(self.bitmaps)
+        index.counts = dict(self.counts)
+        index._values = dict(self._values)
+        if old is None:
+            index.n = self.n + 1
+            if -(-index.n // 64) > len(self.all):
+                index.bitmaps = {key: np.pad(bits, (0, 1)) for key, bits in index.bitmaps.items()}
+            index.all = _pack(np.ones(index.n, dtype=bool))
+            index.none = np.zeros_like(index.all)
+        for field in FIELDS:
+            before = None if old is None else str(getattr(old, field)).lower()
+            after = str(getattr(new, field)).lower()
+            if before != after:
+                if before is not None:
+                    index._flip(field, before, i, False)
+                index._flip(field, after, i, True)
+        return index
+
+    def _flip(self, field, value, i, on):
+        key = field, value
+        bits = self.bitmaps.get(key)
+        if bits is None:
+            bits = self.none.copy()
+            self._values[field] = self._values[field] + [value]
+        else:
+            bits = bits.copy()
+        word, bit = divmod(i, 64)
+        if on:
+            bits[word] |= np.uint64(1 << bit)
+        else:
+            bits[word] &= ~np.uint64(1 << bit)
+        count = self.counts.get(key, 0) + (1 if on else -1)
+        if count:
+            self.bitmaps[key] = bits
+            self.counts[key] = count
+        else:
+            # The last profile with this value is gone
+            del self.bitmaps[key], self.counts[key]
+            self._values[field] = [v for v in self._values[field] if v != value]
+
+
+# Bitmaps over the catalog's current profiles; see Catalog.bitmaps
+def bitmaps_for(catalog):
+    return catalog.bitmaps()
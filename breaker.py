@@ -0,0 +1,192 @@
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(Exception):
+    def __init__(self, name):
+        super().__init__(f"{name} is unavailable right now.")
+        self.name = name
+
+
+# Circuit breaker over a rolling window of calls. Opens when too many recent
+# calls failed or were slow, fails fast while open, then lets a few probe
+# calls through (half-open) and closes again once they succeed.
+class CircuitBreaker:
+    def __init__(
+        self,
+        name,
+        window=60.0,
+        min_calls=5,
+        error_rate=0.5,
+        slow_call=10.0,
+        slow_rate=0.5,
+        open_for=30.0,
+        probes=1,
+    ):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call = slow_call
+        self.slow_rate = slow_rate
+        self.open_for = open_for
+        self.probes = probes
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._in_flight_probes = 0
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now):
+        while self._calls and self._calls[0][0] < now - self.window:
+            self._calls.popleft()
+
+    def _rates(self):
+        n = len(self._calls)
+        if not n:
+            return 0, 0.0, 0.0
+        errors = sum(1 for _, ok, _ in self._calls if not ok)
+        slow = sum(1 for _, _, d in self._calls if d >= self.slow_call)
+        return n, errors / n, slow / n
+
+    def _refuses(self, now):
+        if self.state == OPEN and now - self.opened_at >= self.open_for:
+            self.state = HALF_OPEN
+            self._in_flight_probes = 0
+        return self.state == OPEN or (
+            self.state == HALF_OPEN and self._in_flight_probes >= self.probes
+        )
+
+    # Fail fast without taking a probe slot, for callers with work to do
+    # before the call itself, such as waiting for a rate-limit token
+    def check(self):
+        with self._lock:
+            if self._refuses(time.monotonic()):
+                self.rejected += 1
+                raise CircuitOpen(self.name)
+
+    # Returns the probe token when the call is a half-open probe, else None
+    def before(self):
+        with self._lock:
+            if self._refuses(time.monotonic()):
+                self.rejected += 1
+                raise CircuitOpen(self.name)
+            if self.state == HALF_OPEN:
+                self._in_flight_probes += 1
+                return self.opened_at
+            return None
+
+    # `probe` is what before() returned. Only a probe of the current half-open
+    # spell decides it; a call that started before the circuit opened, or a
+    # probe of an earlier spell, is ignored.
+    def after(self, ok, duration, probe=None):
+        with self._lock:
+            now = time.monotonic()
+            if probe is not None:
+                if self.state != HALF_OPEN or probe != self.opened_at:
+                    return
+                self._in_flight_probes -= 1
+                if ok and duration < self.slow_call:
+                    self.state = CLOSED
+                    self._calls.clear()
+                else:
+                    self.state = OPEN
+                    self.opened_at = now
+                return
+            if self.state != CLOSED:
+                return
+            self._calls.append((now, ok, duration))
+            self._trim(now)
+            n, errors, slow = self._rates()
+            if n >= self.min_calls and (errors >= self.error_rate or slow >= self.slow_rate):
+                self.state = OPEN
+                self.opened_at = now
+
+    # A probe that ended without an answer frees its slot for another one
+    def _release(self, probe):
+        with self._lock:
+            if self.state == HALF_OPEN and probe == self.opened_at:
+                self._in_flight_probes -= 1
+
+    def call_sync(self, fn, *args, **kwargs):
+        probe = self.before()
+        started = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            self.after(False, time.monotonic() - started, probe)
+            raise
+        self.after(True, time.monotonic() - started, probe)
+        return result
+
+    async def call(self, fn, *args, **kwargs):
+        probe = self.before()
+        started = time.monotonic()
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            # Cancelled by the caller (e.g. its deadline), not failed: only
+            # the time it had taken so far counts, as a possibly slow call.
+            # A cancelled probe proves nothing and leaves the circuit as is.
+            if probe is None:
+                self.after(True, time.monotonic() - started)
+            else:
+                self._release(probe)
+            raise
+        except BaseException:
+            self.after(False, time.monotonic() - started, probe)
+            raise
+        self.after(True, time.monotonic() - started, probe)
+        return result
+
+    # Open until further notice, e.g. to keep a service out of offline runs
+    def hold_open(self):
+        with self._lock:
+            self.state = OPEN
+            self.opened_at = math.inf
+
+    def snapshot(self):
+        with self._lock:
+            self._trim(time.monotonic())
+            n, errors, slow = self._rates()
+            latencies = sorted(d for _, _, d in self._calls)
+            return {
+                "name": self.name,
+                "state": self.state,
+                "calls": n,
+                "error_rate": round(errors, 3),
+                "slow_rate": round(slow, 3),
+                "p95_seconds": round(latencies[int(0.95 * (n - 1))], 3) if n else None,
+                "rejected": self.rejected,
+            }
+
+
+def make_breaker(name, prefix):
+    return CircuitBreaker(
+        name,
+        window=float(os.getenv(f"{prefix}_BREAKER_WINDOW", "60")),
+        min_calls=int(os.getenv(f"{prefix}_BREAKER_MIN_CALLS", "5")),
+        error_rate=float(os.getenv(f"{prefix}_BREAKER_ERROR_RATE", "0.5")),
+        slow_call=float(os.getenv(f"{prefix}_BREAKER_SLOW_CALL", "10")),
+        slow_rate=float(os.getenv(f"{prefix}_BREAKER_SLOW_RATE", "0.5")),
+        open_for=float(os.getenv(f"{prefix}_BREAKER_OPEN_FOR", "30")),
+    )
+
+
+# Process-wide breakers for the two external services
+model_breaker = make_breaker("Gemini", "MODEL")
+whatsapp_breaker = make_breaker("UltraMsg", "WHATSAPP")
+breakers = [model_breaker, whatsapp_breaker]
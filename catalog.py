@@ -0,0 +1,266 @@
+import os
+import threading
+
+from dotenv import load_dotenv
+
+from bitmaps import BitmapIndex
+from profiles import Profile
+from semantic import SemanticIndex
+
+load_dotenv()
+
+# Candidates go to the model as one header plus delimiter-separated rows
+# keyed by the stable profile id; gender is implied by the window.
+CANDIDATE_HEADER = "id|name|age|profession|education|location"
+# Single-profile changes remembered for changes_since
+CHANGE_LOG = 1000
+# Windows up to this size are listed in the prompt; larger ones are left to
+# the search tool so prompt size stays bounded
+INLINE_CANDIDATES = int(os.getenv("INLINE_CANDIDATES", "20"))
+
+
+def render_line(r):
+    return f"{r.id}|{r.name}|{r.age}|{r.profession}|{r.education}|{r.location}"
+
+
+# Everything derived from one set of profiles, replaced as a whole when a
+# new dataset is swapped in
+class _State:
+    __slots__ = (
+        "profiles", "lines", "index", "members", "blocks", "columns", "windows", "bitmaps", "semantic"
+    )
+
+    def __init__(self, profiles, columns=None):
+        self.profiles = list(profiles)
+        self.lines = [render_line(r) for r in self.profiles]
+        self.index = {r.id: i for i, r in enumerate(self.profiles)}
+        self.members = {}
+        self.blocks = {}
+        # Finished age windows per (gender, age, spread); see Catalog.window
+        self.windows = {}
+        # Column views of the file the profiles came from, if any
+        self.columns = columns
+        # Bitmap and vector indexes, once built (see Catalog.bitmaps)
+        self.bitmaps = None
+        self.semantic = None
+        for i, r in enumerate(self.profiles):
+            self.members.setdefault((r.gender, r.age), []).append(i)
+        for key in self.members:
+            self.render_block(key)
+
+    def render_block(self, key):
+        members = self.members.get(key)
+        if members:
+            self.blocks[key] = "\n".join(self.lines[i] for i in members)
+        else:
+            self.blocks.pop(key, None)
+            self.members.pop(key, None)
+
+    def build_bitmaps(self):
+        if self.bitmaps is None:
+            self.bitmaps = BitmapIndex(self.profiles, self.columns, self.index)
+        return self.bitmaps
+
+    def build_semantic(self):
+        if self.semantic is None:
+            self.semantic = SemanticIndex(self.profiles, position=self.index)
+        return self.semantic
+
+
+# Profiles with their prompt lines rendered once at load time. Lines are also
+# joined into one block per (gender, age), so an age window is a join of a few
+# cached blocks instead of one f-string per candidate per request. Readers
+# take the current state once per call, so a swap never shows them a mix.
+class Catalog:
+    def __init__(self, profiles, columns=None):
+        self._state = _State(profiles, columns)
+        self._lock = threading.Lock()
+        # Bumped on every change, for what is derived outside the catalog
+        self.version = 0
+        # (version, profile) of recent adds and edits since the last swap,
+        # and the version the log is complete from
+        self._changes = []
+        self._changes_from = 0
+
+    @property
+    def profiles(self):
+        return self._state.profiles
+
+    @property
+    def lines(self):
+        return self._state.lines
+
+    @property
+    def columns(self):
+        return self._state.columns
+
+    # Bitmap and vector indexes over the current profiles. A swapped-in
+    # dataset arrives with both built; the first one builds them on first use
+    # (the warm-up does that before the worker reports ready), under the lock
+    # so no edit lands while they are made.
+    def bitmaps(self):
+        state = self._state
+        if state.bitmaps is None:
+            with self._lock:
+                state.build_bitmaps()
+        return state.bitmaps
+
+    def semantic(self):
+        state = self._state
+        if state.semantic is None:
+            with self._lock:
+                state.build_semantic()
+        return state.semantic
+
+    def get(self, profile_id):
+        state = self._state
+        i = state.index.get(profile_id)
+        return None if i is None else state.profiles[i]
+
+    def next_id(self):
+        return max(self._state.index, default=0) + 1
+
+    # Profiles of `gender` within `spread` years of `age`, plus their prompt
+    # rows when there are few enough to be listed (INLINE_CANDIDATES), else
+    # None. The result depends only on the key, so it is built once per
+    # dataset and shared by every session of the process; the tuple keeps
+    # callers from editing the shared copy.
+    def window(self, gender, age, spread):
+        state = self._state
+        windows = state.windows
+        key = (gender, age, spread)
+        cached = windows.get(key)
+        if cached is None:
+            cached = windows[key] = self._build_window(state, gender, age, spread)
+        return cached
+
+    @staticmethod
+    def _build_window(state, gender, age, spread):
+        matches = []
+        keys = []
+        for a in range(age - spread, age + spread + 1):
+            key = (gender, a)
+            members = state.members.get(key)
+            if members:
+                matches.extend(map(state.profiles.__getitem__, members))
+                keys.append(key)
+        if len(matches) > INLINE_CANDIDATES:
+            return tuple(matches), None
+        return tuple(matches), "\n".join(state.blocks[key] for key in keys)
+
+    # Build every non-empty window up front (each worker process does this
+    # during warm-up), so no request pays for the first join
+    def prefill_windows(self, spread):
+        state = self._state
+        ages = [age for _, age in state.members]
+        if not ages:
+            return 0
+        for gender in {gender for gender, _ in state.members}:
+            for age in range(min(ages) - spread, max(ages) + spread + 1):
+                self.window(gender, age, spread)
+        return len(state.windows)
+
+    # Local index lookup backing the agent's search tool: walks the
+    # (gender, age) buckets in range and filters the rest in place
+    def search(self, gender, min_age, max_age, profession=None, location=None):
+        state = self._state
+        profession = profession.strip().lower() if profession else None
+        location = location.strip().lower() if location else None
+        found = []
+        for a in range(max(min_age, 0), max_age + 1):
+            for i in state.members.get((gender, a), ()):
+                r = state.profiles[i]
+                if profession and profession not in r.profession.lower():
+                    continue
+                if location and location != r.location.lower():
+                    continue
+                found.append(r)
+        return found
+
+    def render(self, profiles):
+        state = self._state
+        return "\n".join(state.lines[state.index[r.id]] for r in profiles)
+
+    def add(self, profile):
+        with self._lock:
+            state = self._state
+            if profile.id in state.index:
+                raise ValueError(f"Profile id {profile.id} already exists")
+            i = len(state.profiles)
+            state.profiles.append(profile)
+            state.lines.append(render_line(profile))
+            state.index[profile.id] = i
+            key = (profile.gender, profile.age)
+            state.members.setdefault(key, []).append(i)
+            state.render_block(key)
+            # Single-profile edits leave the file's columns behind
+            state.columns = None
+            self._changed(state, i, None, profile)
+
+    # Re-render only the changed profile and the blocks it leaves or joins
+    def update(self, profile_id, **changes):
+        with self._lock:
+            state = self._state
+            i = state.index[profile_id]
+            old = state.profiles[i]
+            new = old.replace(**changes)
+            old_key = (old.gender, old.age)
+            new_key = (new.gender, new.age)
+            state.profiles[i] = new
+            state.lines[i] = render_line(new)
+            if new_key != old_key:
+                state.members[old_key].remove(i)
+                state.members.setdefault(new_key, []).append(i)
+                state.members[new_key].sort()
+                state.render_block(old_key)
+            state.render_block(new_key)
+            state.columns = None
+            self._changed(state, i, old, new)
+
+    # A fresh dict rather than clear(): a window built during the edit lands
+    # in the old dict and is dropped with it. Indexes already built get the
+    # one changed profile instead of a rebuild.
+    def _changed(self, state, i, old, profile):
+        state.windows = {}
+        if state.bitmaps is not None:
+            state.bitmaps = state.bitmaps.changed(i, old, profile)
+        if state.semantic is not None:
+            state.semantic = state.semantic.changed(i, profile)
+        self.version += 1
+        self._changes.append((self.version, profile))
+        if len(self._changes) > CHANGE_LOG:
+            del self._changes[0]
+            self._changes_from = self._changes[0][0] - 1
+
+    # Profiles added or edited after `version`, or None when that is not
+    # known any more (a swap, or a log that has moved on)
+    def changes_since(self, version):
+        with self._lock:
+            if version < self._changes_from:
+                return None
+            return [profile for v, profile in self._changes if v > version]
+
+    # Build the new dataset's state and indexes off to the side (on the
+    # caller's thread, such as the dataset refresh), then switch to it in one
+    # assignment; in-flight reads finish on the old one
+    def swap(self, profiles, columns=None):
+        state = _State(profiles, columns)
+        state.build_bitmaps()
+        state.build_semantic()
+        with self._lock:
+            self._state = state
+            self.version += 1
+            self._changes = []
+            self._changes_from = self.version
+
+
+# PROFILES_PATH serves an Arrow export (see dataset.py) instead of data.py
+if os.getenv("PROFILES_PATH"):
+    from dataset import load_into
+
+    catalog = Catalog(())
+    load_into(catalog, os.environ["PROFILES_PATH"])
+else:
+    from data import rishtas
+
+    catalog = Catalog(Profile.from_dict(r) for r in rishtas)
@@ -1,6 +1,7 @@
 rishtas = [
     # Female Rishtas (100)
     {
+        "id": 1,
         "name": "Amna Jawed",
         "age": 18,
         "gender": "Female",
@@ -9,6 +10,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 2,
         "name": "Fatima",
         "age": 20,
         "gender": "Female",
@@ -17,6 +19,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 3,
         "name": "Zainab",
         "age": 19,
         "gender": "Female",
@@ -25,6 +28,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 4,
         "name": "Hira",
         "age": 22,
         "gender": "Female",
@@ -33,6 +37,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 5,
         "name": "Sara",
         "age": 23,
         "gender": "Female",
@@ -41,6 +46,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 6,
         "name": "Mehwish",
         "age": 29,
         "gender": "Female",
@@ -49,6 +55,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 7,
         "name": "Laiba",
         "age": 22,
         "gender": "Female",
@@ -57,6 +64,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 8,
         "name": "Kiran",
         "age": 28,
         "gender": "Female",
@@ -65,6 +73,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 9,
         "name": "Mariam",
         "age": 30,
         "gender": "Female",
@@ -73,6 +82,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 10,
         "name": "Sana",
         "age": 25,
         "gender": "Female",
@@ -81,6 +91,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 11,
         "name": "Amna",
         "age": 26,
         "gender": "Female",
@@ -89,6 +100,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 12,
         "name": "Nimra",
         "age": 27,
         "gender": "Female",
@@ -97,6 +109,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 13,
         "name": "Tania",
         "age": 24,
         "gender": "Female",
@@ -105,6 +118,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 14,
         "name": "Uzma",
         "age": 28,
         "gender": "Female",
@@ -113,6 +127,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 15,
         "name": "Areeba",
         "age": 23,
         "gender": "Female",
@@ -121,6 +136,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 16,
         "name": "Eman",
         "age": 29,
         "gender": "Female",
@@ -129,6 +145,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 17,
         "name": "Iqra",
         "age": 24,
         "gender": "Female",
@@ -137,6 +154,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 18,
         "name": "Anam",
         "age": 25,
         "gender": "Female",
@@ -145,6 +163,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 19,
         "name": "Shazia",
         "age": 28,
         "gender": "Female",
@@ -153,6 +172,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 20,
         "name": "Nazia",
         "age": 27,
         "gender": "Female",
@@ -161,6 +181,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 21,
         "name": "Huma",
         "age": 26,
         "gender": "Female",
@@ -169,6 +190,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 22,
         "name": "Noor",
         "age": 22,
         "gender": "Female",
@@ -177,6 +199,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 23,
         "name": "Yusra",
         "age": 29,
         "gender": "Female",
@@ -185,6 +208,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 24,
         "name": "Sadia",
         "age": 30,
         "gender": "Female",
@@ -193,6 +217,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 25,
         "name": "Hafsa",
         "age": 24,
         "gender": "Female",
@@ -201,6 +226,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 26,
         "name": "Aiman",
         "age": 25,
         "gender": "Female",
@@ -209,6 +235,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 27,
         "name": "Lubna",
         "age": 28,
         "gender": "Female",
@@ -217,6 +244,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 28,
         "name": "Iqbal",
         "age": 27,
         "gender": "Female",
@@ -225,6 +253,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 29,
         "name": "Shaista",
         "age": 24,
         "gender": "Female",
@@ -233,6 +262,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 30,
         "name": "Humaira",
         "age": 29,
         "gender": "Female",
@@ -241,6 +271,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 31,
         "name": "Aqsa",
         "age": 26,
         "gender": "Female",
@@ -249,6 +280,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 32,
         "name": "Aaliya",
         "age": 25,
         "gender": "Female",
@@ -257,6 +289,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 33,
         "name": "Rabia",
         "age": 28,
         "gender": "Female",
@@ -265,6 +298,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 34,
         "name": "Kinza",
         "age": 30,
         "gender": "Female",
@@ -273,6 +307,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 35,
         "name": "Fiza",
         "age": 23,
         "gender": "Female",
@@ -281,6 +316,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 36,
         "name": "Neha",
         "age": 24,
         "gender": "Female",
@@ -289,6 +325,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 37,
         "name": "Bushra",
         "age": 25,
         "gender": "Female",
@@ -297,6 +334,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 38,
         "name": "Sahar",
         "age": 29,
         "gender": "Female",
@@ -305,6 +343,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 39,
         "name": "Reema",
         "age": 26,
         "gender": "Female",
@@ -313,6 +352,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 40,
         "name": "Asma",
         "age": 30,
         "gender": "Female",
@@ -321,6 +361,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 41,
         "name": "Zoya",
         "age": 28,
         "gender": "Female",
@@ -329,6 +370,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 42,
         "name": "Nadia",
         "age": 29,
         "gender": "Female",
@@ -337,6 +379,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 43,
         "name": "Komal",
         "age": 27,
         "gender": "Female",
@@ -345,6 +388,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 44,
         "name": "Rida",
         "age": 26,
         "gender": "Female",
@@ -353,6 +397,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 45,
         "name": "Javeria",
         "age": 25,
         "gender": "Female",
@@ -361,6 +406,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 46,
         "name": "Shumaila",
         "age": 29,
         "gender": "Female",
@@ -369,6 +415,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 47,
         "name": "Haleema",
         "age": 24,
         "gender": "Female",
@@ -377,6 +424,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 48,
         "name": "Najma",
         "age": 30,
         "gender": "Female",
@@ -385,6 +433,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 49,
         "name": "Rukhsar",
         "age": 28,
         "gender": "Female",
@@ -393,6 +442,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 50,
         "name": "Farah",
         "age": 27,
         "gender": "Female",
@@ -401,6 +451,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 51,
         "name": "Ayesha",
         "age": 21,
         "gender": "Female",
@@ -409,6 +460,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 52,
         "name": "Misbah",
         "age": 23,
         "gender": "Female",
@@ -417,6 +469,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 53,
         "name": "Saima",
         "age": 26,
         "gender": "Female",
@@ -425,6 +478,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 54,
         "name": "Sobia",
         "age": 25,
         "gender": "Female",
@@ -433,6 +487,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 55,
         "name": "Tahira",
         "age": 27,
         "gender": "Female",
@@ -441,6 +496,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 56,
         "name": "Rubab",
         "age": 24,
         "gender": "Female",
@@ -449,6 +505,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 57,
         "name": "Sehrish",
         "age": 29,
         "gender": "Female",
@@ -457,6 +514,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 58,
         "name": "Farheen",
         "age": 28,
         "gender": "Female",
@@ -465,6 +523,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 59,
         "name": "Noreen",
         "age": 22,
         "gender": "Female",
@@ -473,6 +532,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 60,
         "name": "Afia",
         "age": 26,
         "gender": "Female",
@@ -481,6 +541,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 61,
         "name": "Sundus",
         "age": 25,
         "gender": "Female",
@@ -489,6 +550,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 62,
         "name": "Arooj",
         "age": 27,
         "gender": "Female",
@@ -497,6 +559,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 63,
         "name": "Mahrukh",
         "age": 24,
         "gender": "Female",
@@ -505,6 +568,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 64,
         "name": "Hania",
         "age": 28,
         "gender": "Female",
@@ -513,6 +577,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 65,
         "name": "Samina",
         "age": 29,
         "gender": "Female",
@@ -521,6 +586,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 66,
         "name": "Alishba",
         "age": 23,
         "gender": "Female",
@@ -529,6 +595,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 67,
         "name": "Safa",
         "age": 26,
         "gender": "Female",
@@ -537,6 +604,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 68,
         "name": "Madiha",
         "age": 25,
         "gender": "Female",
@@ -545,6 +613,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 69,
         "name": "Esha",
         "age": 27,
         "gender": "Female",
@@ -553,6 +622,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 70,
         "name": "Tayyaba",
         "age": 24,
         "gender": "Female",
@@ -561,6 +631,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 71,
         "name": "Zara",
         "age": 28,
         "gender": "Female",
@@ -569,6 +640,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 72,
         "name": "Mahnoor",
         "age": 29,
         "gender": "Female",
@@ -577,6 +649,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 73,
         "name": "Ambreen",
         "age": 26,
         "gender": "Female",
@@ -585,6 +658,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 74,
         "name": "Sumbul",
         "age": 25,
         "gender": "Female",
@@ -593,6 +667,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 75,
         "name": "Anila",
         "age": 27,
         "gender": "Female",
@@ -601,6 +676,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 76,
         "name": "Saba",
         "age": 24,
         "gender": "Female",
@@ -609,6 +685,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 77,
         "name": "Sidra",
         "age": 28,
         "gender": "Female",
@@ -617,6 +694,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 78,
         "name": "Hina",
         "age": 29,
         "gender": "Female",
@@ -625,6 +703,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 79,
         "name": "Amina",
         "age": 26,
         "gender": "Female",
@@ -633,6 +712,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 80,
         "name": "Bushra",
         "age": 25,
         "gender": "Female",
@@ -641,6 +721,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 81,
         "name": "Naila",
         "age": 27,
         "gender": "Female",
@@ -649,6 +730,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 82,
         "name": "Sanaa",
         "age": 24,
         "gender": "Female",
@@ -657,6 +739,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 83,
         "name": "Faryal",
         "age": 28,
         "gender": "Female",
@@ -665,6 +748,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 84,
         "name": "Zunaira",
         "age": 29,
         "gender": "Female",
@@ -673,6 +757,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 85,
         "name": "Roshan",
         "age": 26,
         "gender": "Female",
@@ -681,6 +766,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 86,
         "name": "Iram",
         "age": 25,
         "gender": "Female",
@@ -689,6 +775,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 87,
         "name": "Sadia",
         "age": 27,
         "gender": "Female",
@@ -697,6 +784,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 88,
         "name": "Mehak",
         "age": 24,
         "gender": "Female",
@@ -705,6 +793,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 89,
         "name": "Saira",
         "age": 28,
         "gender": "Female",
@@ -713,6 +802,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 90,
         "name": "Nargis",
         "age": 29,
         "gender": "Female",
@@ -721,6 +811,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 91,
         "name": "Areej",
         "age": 26,
         "gender": "Female",
@@ -729,6 +820,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 92,
         "name": "Huma",
         "age": 25,
         "gender": "Female",
@@ -737,6 +829,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 93,
         "name": "Sumbal",
         "age": 27,
         "gender": "Female",
@@ -745,6 +838,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 94,
         "name": "Naima",
         "age": 24,
         "gender": "Female",
@@ -754,6 +848,7 @@ rishtas = [
     },
     # Male Rishtas (100)
     {
+        "id": 95,
         "name": "Ali",
         "age": 28,
         "gender": "Male",
@@ -762,6 +857,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 96,
         "name": "Ahmed",
         "age": 30,
         "gender": "Male",
@@ -770,6 +866,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 97,
         "name": "Usman",
         "age": 27,
         "gender": "Male",
@@ -778,6 +875,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 98,
         "name": "Hamza",
         "age": 26,
         "gender": "Male",
@@ -786,6 +884,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 99,
         "name": "Zeeshan",
         "age": 29,
         "gender": "Male",
@@ -794,6 +893,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 100,
         "name": "Talha",
         "age": 28,
         "gender": "Male",
@@ -802,6 +902,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 101,
         "name": "Noman",
         "age": 30,
         "gender": "Male",
@@ -810,6 +911,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 102,
         "name": "Danish",
         "age": 25,
         "gender": "Male",
@@ -818,6 +920,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 103,
         "name": "Bilal",
         "age": 26,
         "gender": "Male",
@@ -826,6 +929,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 104,
         "name": "Salman",
         "age": 27,
         "gender": "Male",
@@ -834,6 +938,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 105,
         "name": "Asad",
         "age": 28,
         "gender": "Male",
@@ -842,6 +947,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 106,
         "name": "Rehan",
         "age": 29,
         "gender": "Male",
@@ -850,6 +956,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 107,
         "name": "Saad",
         "age": 30,
         "gender": "Male",
@@ -858,6 +965,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 108,
         "name": "Yasir",
         "age": 26,
         "gender": "Male",
@@ -866,6 +974,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 109,
         "name": "Owais",
         "age": 25,
         "gender": "Male",
@@ -874,6 +983,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 110,
         "name": "Rizwan",
         "age": 27,
         "gender": "Male",
@@ -882,6 +992,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 111,
         "name": "Shahzaib",
         "age": 28,
         "gender": "Male",
@@ -890,6 +1001,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 112,
         "name": "Moiz",
         "age": 29,
         "gender": "Male",
@@ -898,6 +1010,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 113,
         "name": "Waqas",
         "age": 30,
         "gender": "Male",
@@ -906,6 +1019,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 114,
         "name": "Fahad",
         "age": 24,
         "gender": "Male",
@@ -914,6 +1028,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 115,
         "name": "Tariq",
         "age": 25,
         "gender": "Male",
@@ -922,6 +1037,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 116,
         "name": "Adeel",
         "age": 26,
         "gender": "Male",
@@ -930,6 +1046,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 117,
         "name": "Hassan",
         "age": 27,
         "gender": "Male",
@@ -938,6 +1055,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 118,
         "name": "Imran",
         "age": 28,
         "gender": "Male",
@@ -946,6 +1064,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 119,
         "name": "Zubair",
         "age": 29,
         "gender": "Male",
@@ -954,6 +1073,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 120,
         "name": "Shahid",
         "age": 30,
         "gender": "Male",
@@ -962,6 +1082,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 121,
         "name": "Naveed",
         "age": 26,
         "gender": "Male",
@@ -970,6 +1091,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 122,
         "name": "Arslan",
         "age": 27,
         "gender": "Male",
@@ -978,6 +1100,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 123,
         "name": "Umar",
         "age": 28,
         "gender": "Male",
@@ -986,6 +1109,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 124,
         "name": "Ahsan",
         "age": 29,
         "gender": "Male",
@@ -994,6 +1118,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 125,
         "name": "Jawad",
         "age": 30,
         "gender": "Male",
@@ -1002,6 +1127,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 126,
         "name": "Ammar",
         "age": 25,
         "gender": "Male",
@@ -1010,6 +1136,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 127,
         "name": "Junaid",
         "age": 26,
         "gender": "Male",
@@ -1018,6 +1145,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 128,
         "name": "Kashif",
         "age": 27,
         "gender": "Male",
@@ -1026,6 +1154,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 129,
         "name": "Shayan",
         "age": 28,
         "gender": "Male",
@@ -1034,6 +1163,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 130,
         "name": "Rauf",
         "age": 29,
         "gender": "Male",
@@ -1042,6 +1172,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 131,
         "name": "Basit",
         "age": 30,
         "gender": "Male",
@@ -1050,6 +1181,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 132,
         "name": "Kamran",
         "age": 26,
         "gender": "Male",
@@ -1058,6 +1190,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 133,
         "name": "Irfan",
         "age": 27,
         "gender": "Male",
@@ -1066,6 +1199,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 134,
         "name": "Qasim",
         "age": 28,
         "gender": "Male",
@@ -1074,6 +1208,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 135,
         "name": "Waqar",
         "age": 29,
         "gender": "Male",
@@ -1082,6 +1217,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 136,
         "name": "Azhar",
         "age": 30,
         "gender": "Male",
@@ -1090,6 +1226,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 137,
         "name": "Naeem",
         "age": 25,
         "gender": "Male",
@@ -1098,6 +1235,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 138,
         "name": "Taimoor",
         "age": 26,
         "gender": "Male",
@@ -1106,6 +1244,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 139,
         "name": "Omar",
         "age": 27,
         "gender": "Male",
@@ -1114,6 +1253,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 140,
         "name": "Haroon",
         "age": 28,
         "gender": "Male",
@@ -1122,6 +1262,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 141,
         "name": "Faizan",
         "age": 29,
         "gender": "Male",
@@ -1130,6 +1271,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 142,
         "name": "Shabbir",
         "age": 30,
         "gender": "Male",
@@ -1138,6 +1280,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 143,
         "name": "Adnan",
         "age": 25,
         "gender": "Male",
@@ -1146,6 +1289,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 144,
         "name": "Arif",
         "age": 26,
         "gender": "Male",
@@ -1154,6 +1298,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 145,
         "name": "Zain",
         "age": 27,
         "gender": "Male",
@@ -1162,6 +1307,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 146,
         "name": "Farhan",
         "age": 28,
         "gender": "Male",
@@ -1170,6 +1316,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 147,
         "name": "Asim",
         "age": 29,
         "gender": "Male",
@@ -1178,6 +1325,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 148,
         "name": "Hammad",
         "age": 30,
         "gender": "Male",
@@ -1186,6 +1334,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 149,
         "name": "Ibrahim",
         "age": 25,
         "gender": "Male",
@@ -1194,6 +1343,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 150,
         "name": "Taha",
         "age": 26,
         "gender": "Male",
@@ -1202,6 +1352,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 151,
         "name": "Aqeel",
         "age": 27,
         "gender": "Male",
@@ -1210,6 +1361,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 152,
         "name": "Sufyan",
         "age": 28,
         "gender": "Male",
@@ -1218,6 +1370,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 153,
         "name": "Muneeb",
         "age": 29,
         "gender": "Male",
@@ -1226,6 +1379,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 154,
         "name": "Waleed",
         "age": 30,
         "gender": "Male",
@@ -1234,6 +1388,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 155,
         "name": "Zohaib",
         "age": 25,
         "gender": "Male",
@@ -1242,6 +1397,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 156,
         "name": "Daniyal",
         "age": 26,
         "gender": "Male",
@@ -1250,6 +1406,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 157,
         "name": "Amir",
         "age": 27,
         "gender": "Male",
@@ -1258,6 +1415,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 158,
         "name": "Shoaib",
         "age": 28,
         "gender": "Male",
@@ -1266,6 +1424,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 159,
         "name": "Umair",
         "age": 29,
         "gender": "Male",
@@ -1274,6 +1433,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 160,
         "name": "Bilawal",
         "age": 30,
         "gender": "Male",
@@ -1282,6 +1442,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 161,
         "name": "Arham",
         "age": 25,
         "gender": "Male",
@@ -1290,6 +1451,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 162,
         "name": "Faisal",
         "age": 26,
         "gender": "Male",
@@ -1298,6 +1460,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 163,
         "name": "Rahim",
         "age": 27,
         "gender": "Male",
@@ -1306,6 +1469,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 164,
         "name": "Sami",
         "age": 28,
         "gender": "Male",
@@ -1314,6 +1478,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 165,
         "name": "Yousuf",
         "age": 29,
         "gender": "Male",
@@ -1322,6 +1487,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 166,
         "name": "Hussain",
         "age": 30,
         "gender": "Male",
@@ -1330,6 +1496,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 167,
         "name": "Mustafa",
         "age": 25,
         "gender": "Male",
@@ -1338,6 +1505,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 168,
         "name": "Hamid",
         "age": 26,
         "gender": "Male",
@@ -1346,6 +1514,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 169,
         "name": "Rayan",
         "age": 27,
         "gender": "Male",
@@ -1354,6 +1523,7 @@ rishtas = [
         "location": "Islamabad",
     },
     {
+        "id": 170,
         "name": "Ehsan",
         "age": 28,
         "gender": "Male",
@@ -1362,6 +1532,7 @@ rishtas = [
         "location": "Rawalpindi",
     },
     {
+        "id": 171,
         "name": "Salah",
         "age": 29,
         "gender": "Male",
@@ -1370,6 +1541,7 @@ rishtas = [
         "location": "Faisalabad",
     },
     {
+        "id": 172,
         "name": "Nasir",
         "age": 30,
         "gender": "Male",
@@ -1378,6 +1550,7 @@ rishtas = [
         "location": "Peshawar",
     },
     {
+        "id": 173,
         "name": "Amin",
         "age": 25,
         "gender": "Male",
@@ -1386,6 +1559,7 @@ rishtas = [
         "location": "Karachi",
     },
     {
+        "id": 174,
         "name": "Rameez",
         "age": 26,
         "gender": "Male",
@@ -1394,6 +1568,7 @@ rishtas = [
         "location": "Lahore",
     },
     {
+        "id": 175,
         "name": "Zubair",
         "age": 27,
         "gender": "Male",
@@ -0,0 +1,175 @@
+import argparse
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from dotenv import load_dotenv
+
+from profiles import CATEGORICAL, Profile
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Arrow IPC file served instead of data.py, and how often workers check it
+# for a replacement
+PROFILES_PATH = os.getenv("PROFILES_PATH")
+DATASET_CHECK = float(os.getenv("DATASET_CHECK", "5"))
+
+# One row per profile; categorical fields dictionary-encoded, which is also
+# what the bitmap indexes are built from
+SCHEMA = pa.schema(
+    [("id", pa.int32()), ("name", pa.string()), ("age", pa.int16())]
+    + [(field, pa.dictionary(pa.int32(), pa.string())) for field in CATEGORICAL]
+)
+
+
+def to_table(profiles):
+    profiles = list(profiles)
+    arrays = []
+    for field in SCHEMA:
+        values = [getattr(p, field.name) for p in profiles]
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, field.type))
+    return pa.Table.from_arrays(arrays, schema=SCHEMA)
+
+
+# Bring a table from any exporter to SCHEMA with every column in one chunk
+# (multi-batch IPC files, Parquet row groups). A file already in that shape
+# (what `write` produces) passes through without a copy.
+def normalize(table):
+    arrays = []
+    for field in SCHEMA:
+        column = table[field.name]
+        if column.type != field.type:
+            if pa.types.is_dictionary(field.type):
+                column = column.cast(pa.string()).dictionary_encode()
+            else:
+                column = column.cast(field.type)
+        arrays.append(column)
+    table = pa.Table.from_arrays(arrays, schema=SCHEMA)
+    if any(column.num_chunks > 1 for column in table.columns):
+        table = table.combine_chunks()
+    return table
+
+
+# Written to a temporary name next to `path`, then renamed over it, so
+# readers see the old file or the new one and never a partial write
+def write(table, path):
+    tmp = f"{path}.tmp-{os.getpid()}"
+    if path.endswith(".parquet"):
+        pq.write_table(table, tmp)
+    else:
+        with pa.OSFile(tmp, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table.combine_chunks())
+    os.replace(tmp, path)
+
+
+# Arrow IPC files are memory-mapped, so columns are read straight from the
+# page cache; Parquet has to be decoded into memory
+def read(path):
+    if path.endswith(".parquet"):
+        return pq.read_table(path, memory_map=True)
+    return ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+def profiles_from(table):
+    columns = [table[field].to_pylist() for field in Profile.__slots__]
+    return [Profile(*row) for row in zip(*columns)]
+
+
+# Lowercased values and per-row codes of each categorical field and age, as
+# the bitmap index takes them. Dictionary indices and ages are views of the
+# mapped file.
+def columns_from(table):
+    if not table.num_rows:
+        return None
+    columns = {}
+    for field in CATEGORICAL:
+        chunk = table[field].chunk(0)
+        values = [v.lower() for v in chunk.dictionary.to_pylist()]
+        codes = chunk.indices.to_numpy(zero_copy_only=True)
+        if len(set(values)) != len(values):
+            # Values differing only in case share one bitmap
+            unique, remap = np.unique(values, return_inverse=True)
+            values, codes = unique.tolist(), remap[codes]
+        columns[field] = (values, codes)
+    ages, codes = np.unique(table["age"].chunk(0).to_numpy(zero_copy_only=True), return_inverse=True)
+    columns["age"] = ([str(a) for a in ages.tolist()], codes)
+    for field, (_, codes) in columns.items():
+        assert len(codes) == table.num_rows, f"{field} codes cover {len(codes)} of {table.num_rows} rows"
+    return columns
+
+
+def _identity(path):
+    st = os.stat(path)
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+_loaded = None
+_last_check = 0.0
+_loading = threading.Lock()
+
+
+def load_into(catalog, path):
+    global _loaded
+    identity = _identity(path)
+    table = normalize(read(path))
+    catalog.swap(profiles_from(table), columns_from(table))
+    _loaded = identity
+    logger.info("loaded %d profiles from %s", table.num_rows, path)
+
+
+# Cheap per-request check: when PROFILES_PATH was replaced, load the new file
+# on a background thread and swap it in; requests keep using the current
+# dataset meanwhile
+def maybe_refresh(catalog, path=PROFILES_PATH):
+    global _last_check
+    now = time.monotonic()
+    if not path or now - _last_check < DATASET_CHECK:
+        return
+    _last_check = now
+    try:
+        changed = _identity(path) != _loaded
+    except FileNotFoundError:
+        return
+    if changed and _loading.acquire(blocking=False):
+
+        def load():
+            try:
+                load_into(catalog, path)
+            except Exception:
+                logger.exception("could not load %s", path)
+            finally:
+                _loading.release()
+
+        threading.Thread(target=load, name="dataset-refresh", daemon=True).start()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile dataset import/export (Arrow IPC, Parquet)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="write the current catalog to a .arrow or .parquet file")
+    export.add_argument("path")
+    imported = commands.add_parser(
+        "import", help="convert an export to the Arrow file workers serve, replacing it atomically"
+    )
+    imported.add_argument("path")
+    imported.add_argument("--to", default=PROFILES_PATH, required=PROFILES_PATH is None)
+    args = parser.parse_args()
+
+    if args.command == "export":
+        from catalog import catalog
+
+        write(to_table(catalog.profiles), args.path)
+        print(f"wrote {len(catalog.profiles)} profiles to {args.path}")
+    else:
+        table = normalize(read(args.path))
+        write(table, args.to)
+        print(f"imported {table.num_rows} profiles into {args.to}")
@@ -0,0 +1,49 @@
+import contextvars
+import os
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Overall budget for one submission, and how much of it is kept back for
+# sending the WhatsApp message after the model answers
+MATCH_DEADLINE = float(os.getenv("MATCH_DEADLINE", "45"))
+SEND_RESERVE = float(os.getenv("SEND_RESERVE", "5"))
+# "local" picks a match with the local matcher when the model runs out of
+# time; "none" gives up with DeadlineExceeded instead
+DEADLINE_FALLBACK = os.getenv("DEADLINE_FALLBACK", "local")
+
+
+class DeadlineExceeded(Exception):
+    def __init__(self, stage):
+        super().__init__(f"Ran out of time while {stage}.")
+        self.stage = stage
+
+
+# Point in time (monotonic clock) by which a submission must be finished
+class Deadline:
+    def __init__(self, seconds=MATCH_DEADLINE):
+        self.at = time.monotonic() + seconds
+
+    def remaining(self):
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self):
+        return time.monotonic() >= self.at
+
+    # The same deadline brought forward, leaving `seconds` for later work
+    def minus(self, seconds):
+        earlier = Deadline(0)
+        earlier.at = self.at - seconds
+        return earlier
+
+    def check(self, stage):
+        if self.expired:
+            raise DeadlineExceeded(stage)
+
+
+# Deadline of the submission being handled; set by the pipeline so model
+# turns, which never see the run context, can read it
+current_deadline = contextvars.ContextVar("current_deadline", default=None)
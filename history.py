@@ -0,0 +1,62 @@
+import os
+import sqlite3
+import threading
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+# Which profiles each WhatsApp number has already been sent. SQLite (WAL) is
+# the record; an in-memory set per number answers the hot-path lookup and
+# is loaded on startup, then topped up from rows other workers appended.
+class MatchHistory:
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sent = {}
+        self._last_row = 0
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sent ("
+            "number TEXT NOT NULL, profile_id INTEGER NOT NULL, sent_at REAL NOT NULL, "
+            "PRIMARY KEY (number, profile_id))"
+        )
+        self._sync()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _sync(self):
+        rows = self._connect().execute(
+            "SELECT rowid, number, profile_id FROM sent WHERE rowid > ? ORDER BY rowid",
+            (self._last_row,),
+        ).fetchall()
+        with self._lock:
+            for rowid, number, profile_id in rows:
+                self._sent.setdefault(number, set()).add(profile_id)
+                self._last_row = max(self._last_row, rowid)
+
+    # Profile ids already sent to `number`, including other workers' sends
+    def excluded(self, number):
+        self._sync()
+        return frozenset(self._sent.get(number, ()))
+
+    def record(self, number, profile_id):
+        self._connect().execute(
+            "INSERT OR IGNORE INTO sent (number, profile_id, sent_at) VALUES (?, ?, ?)",
+            (number, profile_id, time.time()),
+        )
+        with self._lock:
+            self._sent.setdefault(number, set()).add(profile_id)
+
+
+history = MatchHistory(os.getenv("HISTORY_DB", "history.db"))
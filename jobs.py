@@ -0,0 +1,111 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from dotenv import load_dotenv
+
+from deadline import MATCH_DEADLINE
+
+load_dotenv()
+
+
+# Statuses a job ends in; before that it is queued, matching or sending
+FINISHED = ("done", "rejected", "timeout", "failed")
+# An unfinished job whose row has not moved for this long lost its worker
+# (running jobs are bounded by their deadline; pools touch their queued ones)
+JOB_STALE = float(os.getenv("JOB_STALE", str(MATCH_DEADLINE + 30)))
+# Finished jobs are deleted this long after they finished
+JOB_RETENTION = float(os.getenv("JOB_RETENTION", "86400"))
+ABANDONED = "The matching worker stopped before finishing this job."
+
+
+# Matching jobs in SQLite (WAL), so any API worker process can report on a
+# job another worker accepted
+class JobStore:
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, request TEXT NOT NULL, "
+            "result TEXT, error TEXT, created REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        self._connect().execute("CREATE INDEX IF NOT EXISTS jobs_updated ON jobs (updated)")
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def create(self, request):
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._connect().execute(
+            "INSERT INTO jobs (id, status, request, created, updated) VALUES (?, ?, ?, ?, ?)",
+            (job_id, "queued", json.dumps(request), now, now),
+        )
+        return job_id
+
+    def update(self, job_id, status, result=None, error=None):
+        self._connect().execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, updated = ? WHERE id = ?",
+            (status, None if result is None else json.dumps(result), error, time.time(), job_id),
+        )
+
+    # Keep queued jobs from looking abandoned while they wait for a worker
+    def touch(self, job_ids):
+        now = time.time()
+        self._connect().executemany(
+            "UPDATE jobs SET updated = ? WHERE id = ? AND status = 'queued'",
+            [(now, job_id) for job_id in job_ids],
+        )
+
+    # Fail unfinished jobs nobody is working on any more and delete finished
+    # ones past JOB_RETENTION
+    def prune(self):
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            f"UPDATE jobs SET status = 'failed', error = ?, updated = ? "
+            f"WHERE status NOT IN ({', '.join('?' * len(FINISHED))}) AND updated < ?",
+            (ABANDONED, now, *FINISHED, now - JOB_STALE),
+        )
+        conn.execute(
+            f"DELETE FROM jobs WHERE status IN ({', '.join('?' * len(FINISHED))}) AND updated < ?",
+            (*FINISHED, now - JOB_RETENTION),
+        )
+
+    def get(self, job_id):
+        row = self._connect().execute(
+            "SELECT id, status, request, result, error, created, updated FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        status, error, updated = row["status"], row["error"], row["updated"]
+        if status not in FINISHED and time.time() - updated > JOB_STALE:
+            status, error = "failed", ABANDONED
+            self._connect().execute(
+                "UPDATE jobs SET status = ?, error = ?, updated = ? WHERE id = ? AND updated = ?",
+                (status, error, time.time(), job_id, updated),
+            )
+        return {
+            "job_id": row["id"],
+            "status": status,
+            "request": json.loads(row["request"]),
+            "result": None if row["result"] is None else json.loads(row["result"]),
+            "error": error,
+            "created": row["created"],
+            "updated": updated,
+        }
+
+
+jobs = JobStore(os.getenv("JOBS_DB", "jobs.db"))
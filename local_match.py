@@ -0,0 +1,32 @@
+import numpy as np
+
+from catalog import catalog
+from semantic import index_for
+
+
+# Deterministic stand-in for the agent when the model cannot be used: keep
+# candidates within 3 years of the user, then score text similarity to the
+# custom prompt (or the user's profession), the same city and a close age.
+# Returns the chosen profile (or None) and one reason per criterion.
+def local_match(user, candidates):
+    close = [r for r in candidates if abs(r.age - user["age"]) <= 3]
+    if not close:
+        return None, {
+            "age_reason": "No candidate is within 3 years of your age.",
+            "profession_reason": "Not checked.",
+            "location_reason": "Not checked.",
+        }
+    query = user["custom_prompt"] or user["profession"]
+    similarity = index_for(catalog).scores(query, close)
+    same_city = np.array([r.location == user["location"] for r in close])
+    age_gap = np.array([abs(r.age - user["age"]) for r in close])
+    best = close[int(np.argmax(similarity + 0.3 * same_city - 0.05 * age_gap))]
+    return best, {
+        "age_reason": f"{best.age} is within 3 years of your age ({user['age']}).",
+        "profession_reason": f"{best.profession} is the closest fit to '{query}' among the candidates.",
+        "location_reason": (
+            f"Also from {best.location}."
+            if best.location == user["location"]
+            else f"From {best.location}; no closer fit was found in {user['location']}."
+        ),
+    }
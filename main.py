@@ -1,23 +1,31 @@
+import logging
 import os
-import asyncio
+import time
+import uuid
 import requests
 from dotenv import load_dotenv
 import streamlit as st
-from agents import (
-    AsyncOpenAI,
-    OpenAIChatCompletionsModel,
-    RunConfig,
-    Agent,
-    Runner,
-    function_tool,
-)
-from data import rishtas
+from deadline import Deadline, DeadlineExceeded
+from ratelimit import RateLimitExceeded
 
 # Load environment variables
 load_dotenv()
+# Application logs (cacheable prompt prefix, profile paths, warm-up) at
+# LOG_LEVEL; DEBUG adds the query planner's explain output
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+# One INFO line per HTTP request otherwise
+logging.getLogger("httpx").setLevel(logging.WARNING)
 api = os.getenv("OPENAI_KEY")
 token = os.getenv("TOKEN")
-instance = os.getenv("INSTANCE")
+# When set, matching runs on the HTTP API (api.py) instead of in this process
+api_url = os.getenv("RISHTA_API_URL", "").rstrip("/")
+# Job mode: a submission is queued and the page follows the job by its id,
+# kept in the URL so a reload picks it up again
+job_mode = os.getenv("JOB_MODE", "0") == "1"
+JOB_POLL = float(os.getenv("JOB_POLL", "1"))
 
 # Custom CSS for professional UI
 st.markdown(
@@ -52,6 +60,54 @@ st.markdown(
     "Enter your details and preferences to find a compatible rishta. We'll send the match details to your WhatsApp!"
 )
 
+
+# In-process mode: warm the pipeline up once per Streamlit process, before
+# the first form is shown
+@st.cache_resource(show_spinner="Starting Rishta Bot...")
+def warm_up_pipeline():
+    from pipeline import run_sync
+    from warmup import warm_up
+
+    return run_sync(warm_up())
+
+
+if not api_url:
+    warm_up_pipeline()
+
+
+# In-process job mode: one pool of match workers per Streamlit process, on the
+# pipeline's event loop, shared by every session
+@st.cache_resource
+def job_pool():
+    from pipeline import run_sync
+    from workers import JobPool
+
+    pool = JobPool()
+    run_sync(pool.start())
+    return pool
+
+
+# Current state of the Gemini and UltraMsg circuit breakers
+def service_status():
+    if api_url:
+        try:
+            res = requests.get(f"{api_url}/status", timeout=5)
+            res.raise_for_status()
+            return res.json()["breakers"]
+        except requests.RequestException:
+            return []
+    from breaker import breakers
+
+    return [b.snapshot() for b in breakers]
+
+
+degraded = [b["name"] for b in service_status() if b["state"] != "closed"]
+if degraded:
+    st.warning(
+        f"{' and '.join(degraded)} {'is' if len(degraded) == 1 else 'are'} having trouble right now. "
+        "Matches may be picked without the AI agent or not delivered to WhatsApp."
+    )
+
 # Input form with custom prompt
 with st.form("rishta_form"):
     st.markdown("### Your Details")
@@ -89,124 +145,90 @@ user_data = {
 }
 
 
-# WhatsApp sending tool
-@function_tool
-def send_whatsapp_message(message: str):
-    url = f"https://api.ultramsg.com/{instance}/messages/chat"
-    payload = {
-        "token": token,
-        "to": f"+{user_data['number']}",
-        "body": message,
-    }
-    res = requests.post(url, data=payload)
-    return res.text
+# Run the pipeline in this process, or on the HTTP API when one is configured,
+# within the submission's deadline
+def find_match(user_data, deadline):
+    if api_url:
+        try:
+            res = requests.post(
+                f"{api_url}/match",
+                params={"wait": "true", "timeout": deadline.remaining()},
+                json=user_data,
+                # Some slack for the API to answer once its own deadline hits
+                timeout=deadline.remaining() + 5,
+            )
+        except requests.Timeout:
+            raise DeadlineExceeded("waiting for the matching service")
+        if res.status_code == 429:
+            raise RateLimitExceeded("matching")
+        if res.status_code == 504:
+            raise DeadlineExceeded("finding a match")
+        res.raise_for_status()
+        return res.json()["result"]
+    # Imported here so the thin-client mode never loads the agent stack
+    from pipeline import main, run_sync
+    from profiling import profiled
 
+    return run_sync(profiled(uuid.uuid4().hex, main(user_data, deadline))).as_json()
 
-# Agent setup with updated instructions
-external_agent = AsyncOpenAI(
-    api_key=api, base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
-)
-model = OpenAIChatCompletionsModel(
-    openai_client=external_agent, model="gemini-2.0-flash"
-)
-config = RunConfig(model=model, model_provider=external_agent, tracing_disabled=True)
-
-agent = Agent(
-    name="Rishta_Bot",
-    instructions="""You are Rishta Bot, an advanced matchmaking assistant designed to find the best match for the user based on their custom prompt and provided details.
-
-    - Strictly interpret and enforce the user's custom prompt (e.g., 'I want a partner older than me, AI Engineer from Islamabad').
-    - Only select matches from the opposite gender.
-    - Extract specific criteria from the custom prompt, such as:
-      * Age preferences (e.g., older, younger, same age, specific age)
-      * Specific profession (e.g., AI Engineer)
-      * Specific location (e.g., Islamabad)
-    - For age:
-      * If the prompt specifies an age preference, filter matches accordingly.
-      * If no age preference is specified, assume the user wants a match within 3 years of their own age.
-    - For location:
-      * If the prompt specifies a location, match it exactly unless 'any location' is mentioned.
-      * If no location is specified, prefer matches from the same location as the user.
-    - For profession:
-      * If the prompt specifies a profession, match it exactly (case-insensitive).
-      * If no profession is specified, use the user's provided profession for filtering, or if that's also not available, do not apply a profession filter.
-    - Select only matches that satisfy ALL specified criteria and default filters where applicable.
-    - If no match meets all the criteria, return: 'No match found in the data. Try adjusting your preferences.'
-    - Do NOT include the list of potential matches in the output or reasoning.
-    - When a match is found, construct a WhatsApp message with:
-      * User's details (name, age, gender, profession, education, location)
-      * Match's details (name, age, profession, education, location)
-      * Brief reasoning for the match (e.g., 'This match was chosen because...')
-    - Use the send_whatsapp_message tool to send the message.
-    - Confirm the message was sent with: 'Message successfully sent to WhatsApp.'
-    """,
-    tools=[send_whatsapp_message],
-)
 
+# Queue a matching job and return its id at once
+def submit_job(user_data):
+    if api_url:
+        res = requests.post(f"{api_url}/match", json=user_data, timeout=10)
+        if res.status_code == 429:
+            raise RateLimitExceeded("matching")
+        res.raise_for_status()
+        return res.json()["job_id"]
+    return job_pool().submit_threadsafe(user_data)
 
-# Main logic with strict prompt-based matching
-async def main(user_data):
-    opposite_gender = "Female" if user_data["gender"] == "Male" else "Male"
-    user_age = user_data["age"]
-
-    # --- Pre-filtering the rishtas data ---
-    # Filter by opposite gender and default age range (3 years difference)
-    pre_filtered_matches = []
-    for r in rishtas:
-        if r["gender"] == opposite_gender:
-            if abs(r["age"] - user_age) <= 4:
-                pre_filtered_matches.append(r)
-
-    # Now, the agent will process this pre_filtered_matches list
-    matches_str = (
-        "\n".join(
-            [
-                f"Name: {r['name']}, Age: {r['age']}, Profession: {r['profession']}, Education: {r['education']}, Location: {r['location']}"
-                for r in pre_filtered_matches
-            ]
-        )
-        if pre_filtered_matches
-        else "No suitable initial matches found based on gender and general age range."
-    )
 
-    # Detailed prompt for the agent
-    prompt = f"""
-You are Rishta Bot. The user has provided the following details:
-
-Name: {user_data['name']}
-Age: {user_data['age']}
-Gender: {user_data['gender']}
-Profession: {user_data['profession']}
-Education: {user_data['education']}
-Location: {user_data['location']}
-Custom Prompt: {user_data['custom_prompt'] if user_data['custom_prompt'] else 'No specific preferences provided'}
-
-Available Matches (opposite gender, pre-filtered by a general age range (user_age +/- 4 years) and gender):
-{matches_str}
-
-Your task is to:
-1. Carefully interpret the 'Custom Prompt' to extract **strict** criteria for age, profession, and location.
-2. If the 'Custom Prompt' specifies an **age preference**, override the default age range and apply it strictly (e.g., "older than me", "exactly 25"). If no age preference is in the custom prompt, apply a strict age filter of **+/- 3 years** from the user's age.
-3. If the 'Custom Prompt' specifies a **profession**, match it exactly (case-insensitive). If no profession is specified in the custom prompt, *and* the user provided their own profession, prioritize finding a match with a similar profession. If neither is specified, do not filter by profession.
-4. If the 'Custom Prompt' specifies a **location**, match it exactly. If no location is specified in the custom prompt, prefer matches from the user's same location.
-5. From the "Available Matches" list, **select only ONE best match** that satisfies ALL criteria derived from the custom prompt and default rules. Prioritize exact matches for custom prompt criteria.
-6. If no match meets ALL the criteria, return: 'No match found in the data. Try adjusting your preferences.'
-7. Do NOT include the list of potential matches in the output or reasoning.
-8. For a valid match, construct a WhatsApp message with:
-    * User's details (name, age, gender, profession, education, location)
-    * Match's details (name, age, profession, education, location)
-    * A brief, clear reasoning for the match, explicitly stating how the match meets the user's preferences (e.g., "This match was chosen because [Match Name] is a [Match Profession] from [Match Location], which aligns with your preference for a [User Profession] and [User Location], and is within your preferred age range.").
-9. Send the message using the send_whatsapp_message tool.
-10. Confirm the message was sent with: 'Message successfully sent to WhatsApp.'
-"""
-
-    result = await Runner.run(agent, prompt, run_config=config)
-    return result.final_output, pre_filtered_matches
+def job_status(job_id):
+    if api_url:
+        res = requests.get(f"{api_url}/match/{job_id}", timeout=10)
+        if res.status_code == 404:
+            return None
+        res.raise_for_status()
+        return res.json()
+    from jobs import jobs
+
+    return jobs.get(job_id)
+
+
+RATE_LIMITED_MESSAGE = "Rishta Bot is handling too many requests right now. Please try again in a minute."
+TIMED_OUT_MESSAGE = "Finding a match took too long. Please try again."
+JOB_PROGRESS = {
+    "queued": "Waiting for a free matchmaker...",
+    "matching": "Finding your match...",
+    "sending": "Sending your match to WhatsApp...",
+}
+
+
+def show_result(result, user_data):
+    match, decision = result["match"], result["decision"]
+    if result.get("relaxed"):
+        st.info(f"Too few profiles fit, so we widened your search: {'; '.join(result['relaxed'])}.")
+    if match is None:
+        st.warning(result["message"])
+        return
+    if result["sent"]:
+        st.success("✅ Message sent to WhatsApp!")
+    else:
+        st.warning(result["message"])
+    if result["matched_by"] == "local":
+        st.info("The AI agent was unavailable, so this match was picked by the built-in matcher.")
+    st.markdown("### 🧠 Agent Reasoning:")
+    st.write(f"**Match:** {match['name']}, {match['age']}, {match['profession']} from {match['location']}")
+    st.write(f"**Age:** {decision['age_reason']}")
+    st.write(f"**Profession:** {decision['profession_reason']}")
+    st.write(f"**Location:** {decision['location_reason']}")
+    st.markdown("### 📝 Your Info:")
+    st.json(user_data)
 
 
 # Process form submission
 if submit_button:
-    if not api or not token:
+    if not api_url and (not api or not token):
         st.error("API Key or Token is missing.")
     elif not all([name, age, gender, profession, education, location, number]):
         st.warning("Please fill in all required fields.")
@@ -214,14 +236,43 @@ if submit_button:
         number = number.replace(" ", "").replace("-", "")
         if len(number) > 18 or not number.isdigit():
             st.error("Enter a valid WhatsApp number.")
+        elif job_mode:
+            user_data["number"] = number
+            try:
+                st.query_params["job"] = submit_job(user_data)
+            except RateLimitExceeded:
+                st.error(RATE_LIMITED_MESSAGE)
+                st.stop()
         else:
-            with st.spinner("Finding your match..."):
-                reasoning = asyncio.run(main(user_data))
-            if "No match found" in reasoning:
-                st.warning(reasoning)
-            else:
-                st.success("✅ Message sent to WhatsApp!")
-                st.markdown("### 🧠 Agent Reasoning:")
-                st.write(reasoning)
-                st.markdown("### 📝 Your Info:")
-                st.json(user_data)
+            user_data["number"] = number
+            deadline = Deadline()
+            try:
+                with st.spinner("Finding your match..."):
+                    result = find_match(user_data, deadline)
+            except RateLimitExceeded:
+                st.error(RATE_LIMITED_MESSAGE)
+                st.stop()
+            except DeadlineExceeded:
+                st.error(TIMED_OUT_MESSAGE)
+                st.stop()
+            show_result(result, user_data)
+
+# Follow the job in the URL until it finishes; the page reruns itself every
+# JOB_POLL seconds meanwhile
+job_id = st.query_params.get("job")
+if job_mode and job_id:
+    job = job_status(job_id)
+    if job is None:
+        st.warning("This match request could not be found. Please submit the form again.")
+    elif job["status"] in JOB_PROGRESS:
+        st.info(JOB_PROGRESS[job["status"]])
+        time.sleep(JOB_POLL)
+        st.rerun()
+    elif job["status"] == "done":
+        show_result(job["result"], job["request"])
+    elif job["status"] == "rejected":
+        st.error(RATE_LIMITED_MESSAGE)
+    elif job["status"] == "timeout":
+        st.error(TIMED_OUT_MESSAGE)
+    else:
+        st.error("Something went wrong while finding your match. Please try again.")
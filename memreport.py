@@ -0,0 +1,170 @@
+import argparse
+import functools
+import gc
+import os
+import resource
+import tracemalloc
+
+# Started before anything else is imported, so the dataset and the SDK
+# allocations are traced from the first byte. One frame per allocation keeps
+# the tracing overhead bearable; each allocation is charged to its file.
+tracemalloc.start()
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Repo modules by component; other repo modules count as "pipeline" and
+# library files are attributed by package
+COMPONENTS = {
+    "data.py": "dataset",
+    "profiles.py": "dataset",
+    "catalog.py": "dataset",
+    "prompts.py": "prompts",
+    "semantic.py": "semantic index",
+    "local_match.py": "semantic index",
+    "history.py": "history/jobs",
+    "jobs.py": "history/jobs",
+}
+PACKAGES = {
+    "agents": "agents SDK",
+    "openai": "agents SDK",
+    "httpx": "agents SDK",
+    "httpcore": "agents SDK",
+    "pydantic": "agents SDK",
+    "pydantic_core": "agents SDK",
+    "numpy": "numpy",
+}
+
+
+@functools.cache
+def component(path):
+    if path.startswith("<frozen importlib"):
+        # Bytecode and module objects of everything imported so far
+        return "module code"
+    if os.path.dirname(os.path.abspath(path)) == HERE:
+        return COMPONENTS.get(os.path.basename(path), "pipeline")
+    parts = path.split(os.sep)
+    if "site-packages" in parts:
+        package = parts[parts.index("site-packages") + 1]
+        return PACKAGES.get(package, "other libraries")
+    return "stdlib"
+
+
+def by_component(snapshot):
+    sizes = {}
+    for stat in snapshot.statistics("filename"):
+        name = component(stat.traceback[0].filename)
+        sizes[name] = sizes.get(name, 0) + stat.size
+    return sizes
+
+
+def take(label, stages):
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    )
+    stages.append((label, snapshot, by_component(snapshot)))
+    return snapshot
+
+
+def mib(size):
+    return f"{size / 2**20:9.2f} MiB"
+
+
+def print_stages(stages):
+    names = sorted({n for _, _, sizes in stages for n in sizes})
+    print(f"{'component':<20}" + "".join(f"{label:>16}" for label, _, _ in stages))
+    for name in names:
+        print(f"{name:<20}" + "".join(f"{mib(sizes.get(name, 0)):>16}" for _, _, sizes in stages))
+    print(f"{'total':<20}" + "".join(f"{mib(sum(sizes.values())):>16}" for _, _, sizes in stages))
+
+
+def sample_users(n):
+    from catalog import catalog
+
+    prompts = ["", "Doctor from Lahore", "Software engineer in Karachi, any age"]
+    for i in range(n):
+        p = catalog.profiles[i % len(catalog.profiles)]
+        yield {
+            "name": p.name,
+            "age": p.age,
+            "gender": p.gender,
+            "profession": p.profession,
+            "education": p.education,
+            "location": p.location,
+            "number": f"92300{i:07d}",
+            "custom_prompt": prompts[i % len(prompts)],
+        }
+
+
+def run_requests(n, start=0):
+    from pipeline import main, run_sync
+
+    for user in list(sample_users(start + n))[start:]:
+        run_sync(main(user))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Memory by component before/after the dataset loads and after N requests"
+    )
+    parser.add_argument("-n", "--requests", type=int, default=50)
+    parser.add_argument(
+        "--diff",
+        action="store_true",
+        help="run another N requests and show what kept growing (leak check)",
+    )
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--live-model",
+        action="store_true",
+        help="call Gemini; by default the model breaker is held open and the local matcher answers",
+    )
+    args = parser.parse_args()
+
+    stages = []
+    take("start", stages)
+    import catalog  # noqa: E402,F401
+
+    take("dataset", stages)
+    import pipeline  # noqa: E402,F401
+    from breaker import model_breaker, whatsapp_breaker
+
+    # Never message the sample numbers
+    whatsapp_breaker.hold_open()
+    if not args.live_model:
+        model_breaker.hold_open()
+    take("pipeline", stages)
+    from semantic import index_for
+
+    index_for(catalog.catalog)
+    take("indexes", stages)
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    run_requests(args.requests)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    after = take(f"{args.requests} requests", stages)
+
+    print_stages(stages)
+    print()
+    print("Largest allocations added by the dataset load:")
+    for stat in stages[1][1].compare_to(stages[0][1], "lineno")[: args.top]:
+        print(f"  {stat}")
+
+    print()
+    print(f"Peak while serving requests: {peak / 2**10:.1f} KiB above the warmed-up process")
+
+    if args.diff:
+        run_requests(args.requests, start=args.requests)
+        later = take(f"{2 * args.requests} requests", stages)
+        growth = sum(stages[-1][2].values()) - sum(stages[-2][2].values())
+        print()
+        print(
+            f"Growth over requests {args.requests + 1}-{2 * args.requests}: "
+            f"{growth / 2**10:.1f} KiB ({growth / args.requests:.0f} B per request)"
+        )
+        for stat in later.compare_to(after, "lineno")[: args.top]:
+            if stat.size_diff > 0:
+                print(f"  {stat}")
+
+    print()
+    print(f"peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10:.1f} MiB")
@@ -0,0 +1,96 @@
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from dotenv import load_dotenv
+
+from catalog import catalog
+from planner import age_reach
+
+load_dotenv()
+
+# How long a "no match" from the model is reused, and for how many distinct
+# criteria at most
+NEGATIVE_TTL = float(os.getenv("NEGATIVE_TTL", "3600"))
+NEGATIVE_ENTRIES = int(os.getenv("NEGATIVE_ENTRIES", "10000"))
+
+
+# Everything the candidates and the model's answer depend on, normalized so
+# retries with different case, spacing or punctuation share one entry
+def criteria_key(user, excluded):
+    prompt = " ".join(re.findall(r"[a-z0-9]+", (user.get("custom_prompt") or "").lower()))
+    return (
+        user["gender"],
+        user["age"],
+        user["profession"].strip().lower(),
+        user["location"].strip().lower(),
+        prompt,
+        excluded,
+    )
+
+
+# "No match" answers per criteria, tagged with the catalog version they were
+# given against. After the catalog changes an entry still holds if no profile
+# added or edited since could be a candidate for it: opposite gender, within
+# the widest age range the search can reach. Location and profession are not
+# checked: without prompt criteria any of them is a candidate, and with them
+# widening also reaches nearby cities and related professions. A swapped
+# dataset drops everything.
+class NegativeCache:
+    def __init__(self, catalog, ttl=NEGATIVE_TTL, size=NEGATIVE_ENTRIES):
+        self.catalog = catalog
+        self.ttl = ttl
+        self.size = size
+        self.hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _reaches(self, user, profile):
+        lo, hi = age_reach(user)
+        return profile.gender != user["gender"] and lo <= profile.age <= hi
+
+    # The cached (decision, relaxed) for these criteria, or None
+    def get(self, user, excluded):
+        key = criteria_key(user, excluded)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        decision, relaxed, version, expires = entry
+        if time.monotonic() > expires:
+            self._drop(key)
+            return None
+        current = self.catalog.version
+        if version != current:
+            changes = self.catalog.changes_since(version)
+            if changes is None or any(self._reaches(user, p) for p in changes):
+                self._drop(key)
+                return None
+        with self._lock:
+            if key in self._entries:
+                self._entries[key] = (decision, relaxed, current, expires)
+                self._entries.move_to_end(key)
+            self.hits += 1
+        return decision, relaxed
+
+    # `version` is the catalog version read before the candidates were
+    # picked, so a profile added while the model was answering still counts
+    def put(self, user, excluded, decision, relaxed, version):
+        key = criteria_key(user, excluded)
+        with self._lock:
+            self._entries[key] = (decision, relaxed, version, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def _drop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+negative_cache = NegativeCache(catalog)
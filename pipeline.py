@@ -0,0 +1,406 @@
+import os
+import asyncio
+import threading
+from dataclasses import dataclass, field, replace
+import openai
+import requests
+from dotenv import load_dotenv
+from pydantic import BaseModel
+from agents import (
+    AgentsException,
+    AsyncOpenAI,
+    OpenAIChatCompletionsModel,
+    RunConfig,
+    Agent,
+    Runner,
+    RunContextWrapper,
+    function_tool,
+)
+from bitmaps import bitmaps_for
+from breaker import CircuitOpen, model_breaker, whatsapp_breaker
+from catalog import CANDIDATE_HEADER, INLINE_CANDIDATES, catalog
+from dataset import maybe_refresh
+from deadline import (
+    DEADLINE_FALLBACK,
+    SEND_RESERVE,
+    Deadline,
+    DeadlineExceeded,
+    current_deadline,
+)
+from history import history
+from local_match import local_match
+from negative import negative_cache
+from planner import AGE_SPREAD, AGE_STEP, MAX_AGE_SPREAD, MIN_CANDIDATES, candidates
+from prompts import INSTRUCTIONS, build_prompt, report_prefix
+from semantic import index_for
+from shards import SHARDED, shards_for
+from ratelimit import RateLimitExceeded, model_limiter, whatsapp_limiter
+
+# Load environment variables
+load_dotenv()
+api = os.getenv("OPENAI_KEY")
+token = os.getenv("TOKEN")
+instance = os.getenv("INSTANCE")
+
+
+# Structured agent output: the chosen candidate id (or none) and a short
+# reason per criterion, so the app branches on fields instead of prose
+class MatchResult(BaseModel):
+    match_id: int | None
+    age_reason: str
+    profession_reason: str
+    location_reason: str
+
+
+NO_MATCH_MESSAGE = "No match found in the data. Try adjusting your preferences."
+SENT_MESSAGE = "Message sent to WhatsApp."
+NOT_SENT_MESSAGE = "We found your match, but could not send it to WhatsApp right now."
+NO_CANDIDATES_REASON = "No profile fits, even with the search widened."
+
+
+# WhatsApp message built locally from the chosen profile and the agent's
+# per-criterion reasons
+def format_match_message(user, match, result):
+    return f"""Rishta Bot found a match for you! 💌
+
+Your details:
+Name: {user['name']}
+Age: {user['age']}
+Gender: {user['gender']}
+Profession: {user['profession']}
+Education: {user['education']}
+Location: {user['location']}
+
+Your match:
+Name: {match.name}
+Age: {match.age}
+Profession: {match.profession}
+Education: {match.education}
+Location: {match.location}
+
+Why this match:
+- Age: {result.age_reason}
+- Profession: {result.profession_reason}
+- Location: {result.location_reason}"""
+
+
+# Pooled connections to UltraMsg, reused across sends (and opened ahead of
+# the first one by the warm-up)
+whatsapp_session = requests.Session()
+WHATSAPP_BASE_URL = "https://api.ultramsg.com"
+
+
+def _post_whatsapp(url, payload, timeout):
+    res = whatsapp_session.post(url, data=payload, timeout=timeout)
+    res.raise_for_status()
+    return res.text
+
+
+# Like model turns, an open circuit fails before the limiter wait
+def send_whatsapp_message(number, message, deadline=None):
+    whatsapp_breaker.check()
+    whatsapp_limiter.acquire(deadline)
+    url = f"{WHATSAPP_BASE_URL}/{instance}/messages/chat"
+    payload = {
+        "token": token,
+        "to": f"+{number}",
+        "body": message,
+    }
+    timeout = None
+    if deadline is not None:
+        deadline.check("sending the WhatsApp message")
+        timeout = deadline.remaining()
+    return whatsapp_breaker.call_sync(_post_whatsapp, url, payload, timeout)
+
+
+# Everything one run needs, handed to tools through the agents SDK run
+# context rather than module globals, so concurrent runs never share state
+@dataclass
+class MatchContext:
+    candidate_gender: str
+    excluded: frozenset
+    # Ids the model has been shown, in the prompt or by a tool call
+    shown: set = field(default_factory=set)
+
+
+# Retrieval tool over the local catalog index, so the agent can query for
+# what the custom prompt asks for instead of reading every candidate. Always
+# the opposite gender of the user, whatever the model would ask for.
+@function_tool
+async def search_candidates(
+    ctx: RunContextWrapper[MatchContext],
+    min_age: int,
+    max_age: int,
+    profession: str | None = None,
+    location: str | None = None,
+    limit: int = 10,
+    offset: int = 0,
+) -> str:
+    """Search the rishta profiles and return one page of matching candidates.
+
+    Args:
+        min_age: Youngest age to include.
+        max_age: Oldest age to include.
+        profession: Case-insensitive text the profession must contain, or null for any.
+        location: City to match exactly (case-insensitive), or null for any.
+        limit: Maximum number of candidates to return (at most 25).
+        offset: Number of matching candidates to skip, for paging.
+    """
+    run = ctx.context
+    gender = run.candidate_gender
+    limit = min(limit, 25)
+    if SHARDED:
+        found = await (await shards_for(catalog)).search(
+            gender, min_age, max_age, profession, location, exclude=run.excluded
+        )
+        total = len(found)
+        page = found[offset : offset + limit]
+    else:
+        # Counted on the bitmaps; only the requested page becomes rows
+        bitmaps = bitmaps_for(catalog)
+        bits = bitmaps.match(
+            gender,
+            min_age,
+            max_age,
+            locations=[location] if location else None,
+            exclude=run.excluded,
+        )
+        if profession:
+            bits &= bitmaps.containing("profession", profession)
+        total = bitmaps.count(bits)
+        page = bitmaps.rows(bits, offset, limit)
+    if not page:
+        return f"No candidates found ({total} total)."
+    run.shown.update(r.id for r in page)
+    return f"{total} total, showing {offset + 1}-{offset + len(page)}:\n{CANDIDATE_HEADER}\n{catalog.render(page)}"
+
+
+# Every model turn waits for a token from the shared limiter and goes
+# through the Gemini circuit breaker, with the HTTP timeout cut to what is
+# left of the submission's deadline. An open circuit fails before the
+# limiter wait, so it does not queue for or spend tokens.
+class GuardedModel(OpenAIChatCompletionsModel):
+    async def get_response(self, *args, **kwargs):
+        deadline = current_deadline.get()
+        model_breaker.check()
+        await model_limiter.acquire_async(deadline)
+        if deadline is not None and "model_settings" in kwargs:
+            deadline.check("waiting for the model")
+            settings = kwargs["model_settings"]
+            kwargs["model_settings"] = replace(
+                settings,
+                extra_args={**(settings.extra_args or {}), "timeout": deadline.remaining()},
+            )
+        return await model_breaker.call(super().get_response, *args, **kwargs)
+
+
+# Agent setup with updated instructions
+MODEL_NAME = "gemini-2.0-flash"
+external_agent = AsyncOpenAI(
+    api_key=api, base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
+)
+model = GuardedModel(
+    openai_client=external_agent, model=MODEL_NAME
+)
+config = RunConfig(model=model, model_provider=external_agent, tracing_disabled=True)
+
+agent = Agent[MatchContext](
+    name="Rishta_Bot",
+    instructions=INSTRUCTIONS,
+    tools=[search_candidates],
+    output_type=MatchResult,
+)
+
+# With a custom prompt, only this many best semantic hits reach the agent
+SEMANTIC_TOP_K = int(os.getenv("SEMANTIC_TOP_K", "15"))
+
+
+# Main logic with strict prompt-based matching. `deadline` is the
+# submission's overall budget, started when the form was submitted;
+# `on_stage` is told when the run moves on to "sending".
+async def main(user_data, deadline=None, on_stage=None):
+    if deadline is None:
+        deadline = Deadline()
+    # Pick up a replaced PROFILES_PATH file (loaded in the background)
+    maybe_refresh(catalog)
+    opposite_gender = "Female" if user_data["gender"] == "Male" else "Male"
+    user_age = user_data["age"]
+
+    version = catalog.version
+
+    # Never offer a profile this number has already been sent
+    excluded = history.excluded(user_data["number"])
+    custom_prompt = user_data["custom_prompt"]
+
+    # The model already found nobody for these criteria, and no profile
+    # that could change that has arrived since
+    known = negative_cache.get(user_data, excluded)
+    if known is not None:
+        decision, relaxed = known
+        return MatchOutcome(decision, None, "cache", False, relaxed)
+
+    relaxed = []
+    if SHARDED:
+        # Every location shard filters, excludes and ranks its own profiles;
+        # the best of each are merged here. Too few widens the age band.
+        spread = AGE_SPREAD
+        while True:
+            pre_filtered_matches = await (await shards_for(catalog)).search(
+                opposite_gender,
+                user_age - spread,
+                user_age + spread,
+                exclude=excluded,
+                query=custom_prompt or None,
+                k=SEMANTIC_TOP_K if custom_prompt else None,
+            )
+            if len(pre_filtered_matches) >= MIN_CANDIDATES or spread + AGE_STEP > MAX_AGE_SPREAD:
+                break
+            spread += AGE_STEP
+            relaxed = [f"age {max(user_age - spread, 0)}-{user_age + spread}"]
+        matches_str = catalog.render(pre_filtered_matches)
+        stable_candidates = not excluded and not custom_prompt and not relaxed
+    else:
+        # --- Pre-filtering the rishtas data ---
+        # Opposite gender and +/- 4 years, plus the location and profession
+        # the custom prompt names, most selective filter first; without
+        # prompt criteria the lines come pre-rendered from the catalog. Too
+        # few candidates widens the search step by step.
+        pre_filtered_matches, matches_str, plan = candidates(user_data, excluded)
+        stable_candidates = plan.stable
+        relaxed = plan.relaxations
+
+        # Rank the window against the custom prompt with the local vector index
+        if custom_prompt and len(pre_filtered_matches) > SEMANTIC_TOP_K:
+            pre_filtered_matches = index_for(catalog).rank(
+                custom_prompt, pre_filtered_matches, SEMANTIC_TOP_K
+            )
+            matches_str = catalog.render(pre_filtered_matches)
+            stable_candidates = False
+
+    # Nobody is left even after widening: that answer needs no model call
+    if not pre_filtered_matches:
+        decision = MatchResult(
+            match_id=None,
+            age_reason=NO_CANDIDATES_REASON,
+            profession_reason=NO_CANDIDATES_REASON,
+            location_reason=NO_CANDIDATES_REASON,
+        )
+        return MatchOutcome(decision, None, "filter", False, relaxed)
+
+    context = MatchContext(opposite_gender, excluded)
+    if len(pre_filtered_matches) <= INLINE_CANDIDATES:
+        matches_str = f"{CANDIDATE_HEADER}\n{matches_str}"
+        context.shown.update(r.id for r in pre_filtered_matches)
+    else:
+        matches_str = (
+            f"{len(pre_filtered_matches)} candidates are in this range; they are not listed here. "
+            "Use the search_candidates tool to query for the ones that fit the Custom Prompt."
+        )
+
+    # Rules live in the agent instructions; the message carries candidates
+    # first and the user's details last so the shared prefix stays cacheable
+    prompt, shared = build_prompt(user_data, matches_str, stable_candidates, relaxed)
+    report_prefix(prompt, shared)
+
+    # The model gets the budget minus what sending the message needs;
+    # running out cancels the run, including any in-flight model call
+    model_deadline = deadline.minus(SEND_RESERVE)
+    token = current_deadline.set(model_deadline)
+    try:
+        async with asyncio.timeout(model_deadline.remaining()):
+            result = await Runner.run(agent, prompt, context=context, run_config=config)
+    except (
+        CircuitOpen,
+        RateLimitExceeded,
+        openai.APIError,
+        AgentsException,
+        TimeoutError,
+        DeadlineExceeded,
+    ) as e:
+        timed_out = isinstance(e, (TimeoutError, DeadlineExceeded, openai.APITimeoutError))
+        if timed_out and DEADLINE_FALLBACK != "local":
+            raise DeadlineExceeded("waiting for the model") from e
+        # Gemini is down, failing, over its rate limit or out of time, or
+        # the run broke down (malformed structured output, too many turns):
+        # pick from the window locally
+        match, reasons = local_match(user_data, pre_filtered_matches)
+        decision = MatchResult(match_id=match and match.id, **reasons)
+        matched_by = "local"
+    else:
+        decision = result.final_output
+        matched_by = "model"
+        # Only a profile of the opposite gender this run actually showed counts
+        match = None
+        if decision.match_id in context.shown:
+            match = catalog.get(decision.match_id)
+            if match is not None and match.gender != opposite_gender:
+                match = None
+        if decision.match_id is None:
+            negative_cache.put(user_data, excluded, decision, relaxed, version)
+    finally:
+        current_deadline.reset(token)
+
+    sent = False
+    if match is not None:
+        if on_stage is not None:
+            on_stage("sending")
+        try:
+            # Blocking HTTP call, kept off the event loop other requests share
+            await asyncio.to_thread(
+                send_whatsapp_message,
+                user_data["number"],
+                format_match_message(user_data, match, decision),
+                deadline,
+            )
+        except (CircuitOpen, RateLimitExceeded, requests.RequestException, DeadlineExceeded):
+            # The match stands; it is returned unsent
+            pass
+        else:
+            sent = True
+            history.record(user_data["number"], match.id)
+    return MatchOutcome(decision, match, matched_by, sent, relaxed)
+
+
+# What main() found and did, plus its JSON form for the HTTP API and clients.
+# `matched_by` is "model", "local" (fallback matcher), "filter" (nobody
+# passed the filters) or "cache" (the model's earlier "no match" for the same
+# criteria); `relaxed` lists how the search was widened.
+@dataclass
+class MatchOutcome:
+    decision: MatchResult
+    match: object
+    matched_by: str
+    sent: bool
+    relaxed: list = field(default_factory=list)
+
+    def as_json(self):
+        if self.match is None:
+            message = NO_MATCH_MESSAGE
+        else:
+            message = SENT_MESSAGE if self.sent else NOT_SENT_MESSAGE
+        return {
+            "match": self.match.as_dict() if self.match else None,
+            "decision": self.decision.model_dump(),
+            "matched_by": self.matched_by,
+            "sent": self.sent,
+            "relaxed": self.relaxed,
+            "message": message,
+        }
+
+
+# One long-lived event loop per process for in-process callers such as
+# Streamlit script threads, so the shared AsyncOpenAI client always runs on
+# the loop its pooled connections belong to
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def run_sync(coro):
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="pipeline-loop", daemon=True
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
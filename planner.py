@@ -0,0 +1,313 @@
+import argparse
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+
+from dotenv import load_dotenv
+
+from bitmaps import bitmaps_for
+from catalog import INLINE_CANDIDATES, catalog
+from semantic import FIELDS, STOPWORDS, fields_of
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Default age band around the user, as in the prompt heading
+AGE_SPREAD = 4
+# Below this many candidates the search is widened step by step: the age
+# band by AGE_STEP years per side up to MAX_AGE_SPREAD, then nearby
+# locations, then related professions
+MIN_CANDIDATES = int(os.getenv("MIN_CANDIDATES", "1"))
+MAX_AGE_SPREAD = int(os.getenv("MAX_AGE_SPREAD", "10"))
+AGE_STEP = 2
+# Cities close enough to stand in for each other
+NEARBY = {
+    "islamabad": ("rawalpindi", "peshawar"),
+    "rawalpindi": ("islamabad", "peshawar"),
+    "peshawar": ("islamabad", "rawalpindi"),
+    "lahore": ("faisalabad",),
+    "faisalabad": ("lahore",),
+}
+# A phrase is negated when one of these comes shortly before it in the same
+# clause; a contrasting "but" ("not a doctor but an engineer") ends the clause
+NEGATION = re.compile(
+    r"\b(?:not|no|except|without|other than|anything but)\b(?:(?!\bbut\b)[\w ]){0,20}$"
+)
+
+
+# One filter of a plan. `values` are ORed; `source` says whether it comes
+# from the user's profile, was read from the custom prompt, or was widened
+# from either when too few candidates were left.
+@dataclass
+class Predicate:
+    field: str
+    values: list
+    source: str = "profile"
+
+    @property
+    def label(self):
+        if self.field == "age":
+            return f"age {self.values[0]}-{self.values[-1]}"
+        if self.field == "exclude":
+            return f"not already sent ({len(self.values)} ids)"
+        shown = ", ".join(str(v) for v in self.values[:4])
+        more = f", +{len(self.values) - 4}" if len(self.values) > 4 else ""
+        return f"{self.field} in ({shown}{more})"
+
+    def selectivity(self, bitmaps):
+        if not bitmaps.n:
+            return 0.0
+        if self.field == "exclude":
+            return 1 - len(self.values) / bitmaps.n
+        rows = sum(bitmaps.counts.get((self.field, str(v).lower()), 0) for v in self.values)
+        return rows / bitmaps.n
+
+    def bits(self, bitmaps):
+        if self.field == "exclude":
+            return ~bitmaps.ids(self.values)
+        return bitmaps.any_of(self.field, self.values)
+
+
+def _mentioned(text, phrase):
+    for m in re.finditer(rf"\b{re.escape(phrase)}\b", text):
+        if not NEGATION.search(text[: m.start()]):
+            return True
+    return False
+
+
+# Age band: the default spread around the user, narrowed or moved by what
+# the custom prompt says about age
+def _age_band(age, prompt):
+    lo, hi, source = age - AGE_SPREAD, age + AGE_SPREAD, "profile"
+    exact = re.search(r"\b(?:exactly|aged?)\s+(\d{2})\b", prompt)
+    if exact:
+        lo = hi = int(exact.group(1))
+        source = "prompt"
+    elif re.search(r"\bsame age\b", prompt):
+        lo = hi = age
+        source = "prompt"
+    elif re.search(r"\bolder\b", prompt):
+        lo, source = age + 1, "prompt"
+    elif re.search(r"\byounger\b", prompt):
+        hi, source = age - 1, "prompt"
+    return Predicate("age", list(range(max(lo, 0), hi + 1)), source)
+
+
+# Predicates for a user: opposite gender and the age band from the profile,
+# location and profession when the custom prompt names them, and the ids
+# already sent to this number
+def predicates_for(user, excluded, bitmaps):
+    prompt = (user.get("custom_prompt") or "").lower()
+    opposite = "Female" if user["gender"] == "Male" else "Male"
+    predicates = [Predicate("gender", [opposite]), _age_band(user["age"], prompt)]
+    if prompt and "any location" not in prompt:
+        locations = [v for v in bitmaps.values("location") if _mentioned(prompt, v)]
+        if locations:
+            predicates.append(Predicate("location", locations, "prompt"))
+    if prompt:
+        professions = [v for v in bitmaps.values("profession") if _mentioned(prompt, v)]
+        if not professions:
+            words = {w for w in re.findall(r"[a-z]{4,}", prompt) if w not in STOPWORDS}
+            professions = [
+                v
+                for v in bitmaps.values("profession")
+                if any(_mentioned(prompt, w) for w in words & set(v.split()))
+            ]
+        if not professions:
+            # Broad fields ("someone in healthcare") stand for their professions
+            terms = [
+                t
+                for tag, field_terms in FIELDS.items()
+                if any(_mentioned(prompt, w) for w in tag.split())
+                for t in field_terms
+            ]
+            professions = [
+                v for v in bitmaps.values("profession") if any(t in v for t in terms)
+            ]
+        if professions:
+            predicates.append(Predicate("profession", professions, "prompt"))
+    if excluded:
+        predicates.append(Predicate("exclude", sorted(excluded)))
+    return predicates
+
+
+# An ordered filter plan and, once executed, the rows left after each step.
+# Plans of only gender and age (plus exclusions) read the catalog's
+# pre-rendered age window; anything else intersects bitmaps, most selective
+# predicate first, and stops as soon as nothing is left. Prompt rows come
+# back only for results small enough to be listed (INLINE_CANDIDATES).
+@dataclass
+class Plan:
+    predicates: list
+    access: str
+    estimates: list = field(default_factory=list)
+    counts: list = field(default_factory=list)
+    stable: bool = False
+    # The plan that found too few candidates, when this one widens it, and
+    # the widenings in effect here
+    relaxed_from: object = None
+    relaxations: list = field(default_factory=list)
+
+    def execute(self, catalog, bitmaps):
+        self.counts = []
+        if self.access == "window":
+            gender, band = self.predicates[0].values[0], self.predicates[1].values
+            matches, text = catalog.window(gender, band[0] + AGE_SPREAD, AGE_SPREAD)
+            self.counts += [None, len(matches)]
+            self.stable = True
+            for p in self.predicates[2:]:
+                kept = [r for r in matches if r.id not in p.values]
+                self.stable = self.stable and len(kept) == len(matches)
+                matches = kept
+                self.counts.append(len(matches))
+            if len(matches) > INLINE_CANDIDATES:
+                return matches, None
+            return matches, text if self.stable else catalog.render(matches)
+        bits = bitmaps.all.copy()
+        for p in self.predicates:
+            if self.counts and self.counts[-1] == 0:
+                self.counts.append(0)
+                continue
+            bits &= p.bits(bitmaps)
+            self.counts.append(bitmaps.count(bits))
+        matches = bitmaps.rows(bits)
+        if len(matches) > INLINE_CANDIDATES:
+            return matches, None
+        return matches, catalog.render(matches)
+
+    def explain(self):
+        lines = []
+        if self.relaxed_from is not None:
+            found = self.relaxed_from.counts[-1] if self.relaxed_from.counts else 0
+            lines += [
+                self.relaxed_from.explain(),
+                f"found {found}; widened to {'; '.join(self.relaxations)}:",
+            ]
+        lines.append(f"access: {self.access}")
+        for i, p in enumerate(self.predicates):
+            estimate = f"est {self.estimates[i]:7.1f}" if i < len(self.estimates) else ""
+            actual = ""
+            if i < len(self.counts):
+                actual = "-> (window)" if self.counts[i] is None else f"-> {self.counts[i]}"
+            lines.append(f"{i + 1}. {p.label:<48} [{p.source}] {estimate} {actual}")
+        return "\n".join(lines)
+
+
+# Plans of only gender and the default age band read the age window; any
+# prompt or widened predicate goes through the bitmaps
+def plan(predicates, bitmaps):
+    if all(p.source == "profile" for p in predicates):
+        ordered = predicates
+        access = "window"
+    else:
+        ordered = sorted(predicates, key=lambda p: p.selectivity(bitmaps))
+        access = "bitmaps"
+    estimates = []
+    rows = float(bitmaps.n)
+    for p in ordered:
+        rows *= p.selectivity(bitmaps)
+        estimates.append(rows)
+    return Plan(ordered, access, estimates)
+
+
+# Widest age range any widening of a user's search can reach
+def age_reach(user):
+    age = user["age"]
+    band = _age_band(age, (user.get("custom_prompt") or "").lower())
+    extra = MAX_AGE_SPREAD - AGE_SPREAD
+    lo = min(band.values[0], age - AGE_SPREAD) - extra
+    hi = max(band.values[-1], age + AGE_SPREAD) + extra
+    return max(lo, 0), hi
+
+
+def _replace(predicates, new):
+    return [new if p.field == new.field else p for p in predicates]
+
+
+# The age band `extra` years wider per side. A band the prompt put above
+# ("older") or below ("younger") the user only grows away from them.
+def _widen_age(band, age, extra):
+    lo, hi = band.values[0], band.values[-1]
+    older = band.source == "prompt" and lo == age + 1
+    younger = band.source == "prompt" and hi == age - 1
+    if not older:
+        lo -= extra
+    if not younger:
+        hi += extra
+    return Predicate("age", list(range(max(lo, 0), hi + 1)), "relaxed")
+
+
+def _widen_ages(predicates, age, applied):
+    band = next(p for p in predicates if p.field == "age")
+    for extra in range(AGE_STEP, MAX_AGE_SPREAD - AGE_SPREAD + 1, AGE_STEP):
+        wider = _widen_age(band, age, extra)
+        applied["age"] = wider.label
+        yield _replace(predicates, wider)
+
+
+# Successively wider predicate lists for a user, each with the widenings in
+# effect: the age band, then nearby locations, then related professions. The
+# custom prompt's criteria are never dropped; if even the widest plan finds
+# nobody, there is no match.
+def _relaxations(user, predicates, bitmaps):
+    applied = {}
+    current = predicates
+    for current in _widen_ages(predicates, user["age"], applied):
+        yield current, applied
+    by_field = {p.field: p for p in current}
+    location = by_field.get("location")
+    if location is not None:
+        nearby = [n for v in location.values for n in NEARBY.get(v, ()) if n not in location.values]
+        if nearby:
+            nearby = list(dict.fromkeys(nearby))
+            current = _replace(current, Predicate("location", location.values + nearby, "relaxed"))
+            applied["location"] = f"nearby locations ({', '.join(n.title() for n in nearby)})"
+            yield current, applied
+    profession = by_field.get("profession")
+    if profession is not None:
+        tags = {tag for v in profession.values for tag in fields_of(v)}
+        related = [
+            v
+            for v in bitmaps.values("profession")
+            if v not in profession.values and tags & set(fields_of(v))
+        ]
+        if related:
+            current = _replace(current, Predicate("profession", profession.values + related, "relaxed"))
+            applied["profession"] = f"related professions ({len(related)} more)"
+            yield current, applied
+
+
+# Candidates for a user: plan, execute, and while fewer than MIN_CANDIDATES
+# are left, widen the search one step at a time. The chosen plan records
+# which widenings it needed.
+def candidates(user, excluded, catalog=catalog):
+    bitmaps = bitmaps_for(catalog)
+    predicates = predicates_for(user, excluded, bitmaps)
+    chosen = plan(predicates, bitmaps)
+    matches, text = chosen.execute(catalog, bitmaps)
+    if len(matches) < MIN_CANDIDATES:
+        for relaxed, applied in _relaxations(user, predicates, bitmaps):
+            previous = chosen
+            chosen = plan(relaxed, bitmaps)
+            chosen.relaxed_from = previous
+            chosen.relaxations = list(applied.values())
+            matches, text = chosen.execute(catalog, bitmaps)
+            if len(matches) >= MIN_CANDIDATES:
+                break
+    logger.debug("query plan:\n%s", chosen.explain())
+    return matches, text, chosen
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show the candidate query plan for a user")
+    parser.add_argument("--gender", choices=["Male", "Female"], required=True)
+    parser.add_argument("--age", type=int, required=True)
+    parser.add_argument("--prompt", default="")
+    parser.add_argument("--exclude", type=int, nargs="*", default=[])
+    args = parser.parse_args()
+
+    user = {"gender": args.gender, "age": args.age, "custom_prompt": args.prompt}
+    matches, _, chosen = candidates(user, frozenset(args.exclude))
+    print(chosen.explain())
+    print(f"{len(matches)} candidates: {', '.join(str(r.id) for r in matches[:20])}")
@@ -0,0 +1,33 @@
+import sys
+
+# Fields with a small set of repeating values; interned so every profile
+# shares one string object per distinct value
+CATEGORICAL = ("gender", "profession", "education", "location")
+
+
+# Compact profile record: fixed slots instead of a per-profile dict with six
+# key strings, and interned categorical values
+class Profile:
+    __slots__ = ("id", "name", "age", "gender", "profession", "education", "location")
+
+    def __init__(self, id, name, age, gender, profession, education, location):
+        self.id = int(id)
+        self.name = name
+        self.age = int(age)
+        self.gender = sys.intern(gender)
+        self.profession = sys.intern(profession)
+        self.education = sys.intern(education)
+        self.location = sys.intern(location)
+
+    @classmethod
+    def from_dict(cls, r):
+        return cls(**{field: r[field] for field in cls.__slots__})
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def replace(self, **changes):
+        return Profile(**{**self.as_dict(), **changes})
+
+    def __repr__(self):
+        return f"Profile({self.id}, {self.name!r}, {self.age}, {self.gender!r}, {self.profession!r}, {self.education!r}, {self.location!r})"
@@ -0,0 +1,134 @@
+import asyncio
+import contextvars
+import logging
+import os
+import random
+import sys
+import threading
+from collections import Counter
+
+from dotenv import load_dotenv
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Profile every submission, or a random share of them
+PROFILE_REQUESTS = os.getenv("PROFILE_REQUESTS", "0") == "1"
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+
+# Id of the request the current task belongs to, when it is being profiled;
+# tasks the run spawns (tool calls, to_thread) inherit it
+profiled_request = contextvars.ContextVar("profiled_request", default=None)
+
+
+def should_profile():
+    return PROFILE_REQUESTS or (PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE)
+
+
+def _label(frame):
+    code = frame.f_code
+    name = f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return name.replace(";", ":")
+
+
+# Frames of a suspended coroutine, following what it awaits down to the
+# innermost coroutine or generator
+def _awaited_frames(coro):
+    frames = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return frames
+
+
+# Wall-clock sampling profiler for one request on a shared event loop. Every
+# interval it records the stack of each task of the request: the live stack
+# if the task is running, or where it is suspended (ending in "(waiting)").
+# Counts are kept as folded stacks, the input format of flamegraph.pl,
+# speedscope and inferno.
+class RequestProfiler(threading.Thread):
+    def __init__(self, request_id, loop, loop_thread, interval=PROFILE_INTERVAL):
+        super().__init__(name=f"profiler-{request_id}", daemon=True)
+        self.request_id = request_id
+        self.loop = loop
+        self.loop_thread = loop_thread
+        self.interval = interval
+        self.stacks = Counter()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            self._sample()
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+    def _sample(self):
+        running = asyncio.current_task(self.loop)
+        live = sys._current_frames().get(self.loop_thread)
+        tasks = [
+            t
+            for t in asyncio.all_tasks(self.loop)
+            if t.get_context().get(profiled_request) == self.request_id
+        ]
+        # Tasks waiting on other tasks (awaited directly or gathered) are
+        # sampled through those, with their own frames as the prefix
+        parents = {}
+        for task in tasks:
+            waiting_on = getattr(task, "_fut_waiter", None)
+            if isinstance(waiting_on, asyncio.Task):
+                parents[waiting_on] = task
+            for child in getattr(waiting_on, "_children", None) or ():
+                parents[child] = task
+        waiting = set(parents.values())
+        for task in tasks:
+            if task in waiting:
+                continue
+            coro = task.get_coro()
+            if task is running and live is not None:
+                frames = []
+                frame = live
+                while frame is not None:
+                    frames.append(frame)
+                    if frame is coro.cr_frame:
+                        break
+                    frame = frame.f_back
+                labels = [_label(f) for f in reversed(frames)]
+            else:
+                labels = [_label(f) for f in _awaited_frames(coro)] + ["(waiting)"]
+            parent = parents.get(task)
+            while parent is not None:
+                labels = [_label(f) for f in _awaited_frames(parent.get_coro())] + labels
+                parent = parents.get(parent)
+            self.stacks[";".join(labels)] += 1
+
+    def write(self, directory=PROFILE_DIR):
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.request_id}.folded")
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+
+# Await `coro` for request `request_id`, profiled when this request is
+# picked; otherwise costs one flag check
+async def profiled(request_id, coro):
+    if not should_profile():
+        return await coro
+    token = profiled_request.set(request_id)
+    profiler = RequestProfiler(request_id, asyncio.get_running_loop(), threading.get_ident())
+    profiler.start()
+    try:
+        return await coro
+    finally:
+        profiled_request.reset(token)
+        profiler.stop()
+        path = profiler.write()
+        logger.info("profile for request %s written to %s", request_id, path)
@@ -0,0 +1,64 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# The one copy of the matching rules and answer schema. It goes out as the
+# system message, so it is the same leading text on every request.
+INSTRUCTIONS = """You are Rishta Bot, an advanced matchmaking assistant. Find the ONE best match for the user, based on their custom prompt and provided details.
+
+Candidates:
+- Candidates are of the opposite gender and given as a table with the header 'id|name|age|profession|education|location'.
+- When they are not listed in the message, use the search_candidates tool to query for candidates that fit the extracted criteria.
+
+Rules:
+1. Strictly interpret the user's Custom Prompt (e.g., 'I want a partner older than me, AI Engineer from Islamabad') and extract criteria for age, profession and location.
+2. Age: if the Custom Prompt specifies an age preference (older, younger, same age, exactly 25), apply it strictly. Otherwise keep within 3 years of the user's age.
+3. Profession: if the Custom Prompt specifies a profession, match it exactly (case-insensitive). Otherwise prefer a profession similar to the user's own; if that is not available either, do not filter by profession.
+4. Location: if the Custom Prompt specifies a location, match it exactly unless it says 'any location'. Otherwise prefer matches from the user's own location.
+5. Select only a match that satisfies ALL criteria derived from the Custom Prompt and these defaults, prioritizing exact matches for Custom Prompt criteria.
+
+Answer with:
+- match_id: the chosen candidate's id, or null if no candidate meets ALL the criteria.
+- age_reason, profession_reason, location_reason: one brief reason each stating how the match meets (or why no candidate met) the user's preference.
+"""
+
+CANDIDATES_HEADING = "Available Matches (opposite gender, pre-filtered to +/- 4 years of the user's age):"
+RELAXED_NOTE = (
+    "Too few candidates fit the pre-filter, so it was widened ({}). "
+    "The rules still apply: a candidate outside what the Custom Prompt asks for is not a match."
+)
+
+
+# Per-request message laid out static-first: the candidate block (identical
+# for every user of the same gender and age unless it was re-ranked), then
+# the user's own details last. Returns the message and how many of its
+# leading characters can be shared with other requests. `relaxed` lists how
+# the search was widened, if it was.
+def build_prompt(user, candidates, stable_candidates, relaxed=()):
+    head = f"{CANDIDATES_HEADING}\n{candidates}\n\n"
+    if relaxed:
+        head = f"{CANDIDATES_HEADING}\n{RELAXED_NOTE.format('; '.join(relaxed))}\n{candidates}\n\n"
+    tail = f"""User details:
+Name: {user['name']}
+Age: {user['age']}
+Gender: {user['gender']}
+Profession: {user['profession']}
+Education: {user['education']}
+Location: {user['location']}
+Custom Prompt: {user['custom_prompt'] if user['custom_prompt'] else 'No specific preferences provided'}
+"""
+    shared = len(head) if stable_candidates else len(CANDIDATES_HEADING) + 1
+    return head + tail, shared
+
+
+def report_prefix(prompt, shared):
+    cacheable = len(INSTRUCTIONS) + shared
+    total = len(INSTRUCTIONS) + len(prompt)
+    logger.info(
+        "prompt %d chars, cacheable prefix %d chars (~%d tokens, %.0f%%)",
+        total,
+        cacheable,
+        cacheable // 4,
+        100 * cacheable / total,
+    )
+    return cacheable
@@ -0,0 +1,171 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from dotenv import load_dotenv
+
+from deadline import DeadlineExceeded
+
+load_dotenv()
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, name):
+        super().__init__(f"Too many pending {name} requests, try again shortly.")
+        self.name = name
+
+
+# In-process token bucket, shared by every Streamlit session in this worker
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    # Take one token; returns 0 on success, otherwise seconds until one is free
+    def take(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+
+# Same bucket kept in a SQLite file so every worker process draws from it
+class SQLiteTokenBucket:
+    def __init__(self, path, name, rate, burst):
+        self.path = path
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(name TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def take(self):
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+            tokens, updated = row if row else (float(self.burst), now)
+            tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+            delay = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                delay = (1 - tokens) / self.rate
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                (self.name, tokens, now),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return delay
+
+
+# Admission control in front of a bucket: callers wait for a token, but only
+# `max_waiters` may queue at once and nobody waits longer than `max_wait`
+# or past their own deadline.
+class Limiter:
+    def __init__(self, name, bucket, max_waiters, max_wait):
+        self.name = name
+        self.bucket = bucket
+        self.max_waiters = max_waiters
+        self.max_wait = max_wait
+        self.waiters = 0
+        self._lock = threading.Lock()
+
+    def _enqueue(self):
+        with self._lock:
+            if self.waiters >= self.max_waiters:
+                raise RateLimitExceeded(self.name)
+            self.waiters += 1
+
+    def _dequeue(self):
+        with self._lock:
+            self.waiters -= 1
+
+    def acquire(self, deadline=None):
+        delay = self.bucket.take()
+        if not delay:
+            return
+        self._enqueue()
+        try:
+            give_up = time.monotonic() + self.max_wait
+            while delay:
+                if deadline is not None and time.monotonic() + delay > deadline.at:
+                    raise DeadlineExceeded(f"waiting for the {self.name} rate limit")
+                if time.monotonic() + delay > give_up:
+                    raise RateLimitExceeded(self.name)
+                time.sleep(delay)
+                delay = self.bucket.take()
+        finally:
+            self._dequeue()
+
+    async def acquire_async(self, deadline=None):
+        delay = self.bucket.take()
+        if not delay:
+            return
+        self._enqueue()
+        try:
+            give_up = time.monotonic() + self.max_wait
+            while delay:
+                if deadline is not None and time.monotonic() + delay > deadline.at:
+                    raise DeadlineExceeded(f"waiting for the {self.name} rate limit")
+                if time.monotonic() + delay > give_up:
+                    raise RateLimitExceeded(self.name)
+                await asyncio.sleep(delay)
+                delay = self.bucket.take()
+        finally:
+            self._dequeue()
+
+
+def make_limiter(name, per_minute, burst):
+    rate = per_minute / 60
+    db = os.getenv("RATE_LIMIT_DB")
+    if db:
+        bucket = SQLiteTokenBucket(db, name, rate, burst)
+    else:
+        bucket = TokenBucket(rate, burst)
+    return Limiter(
+        name,
+        bucket,
+        max_waiters=int(os.getenv("RATE_LIMIT_QUEUE", "20")),
+        max_wait=float(os.getenv("RATE_LIMIT_MAX_WAIT", "30")),
+    )
+
+
+# Process-wide limiters; this module is imported once per worker, so they
+# survive Streamlit reruns and are shared between sessions.
+model_limiter = make_limiter(
+    "model", float(os.getenv("MODEL_RPM", "15")), int(os.getenv("MODEL_BURST", "5"))
+)
+whatsapp_limiter = make_limiter(
+    "WhatsApp",
+    float(os.getenv("WHATSAPP_RPM", "30")),
+    int(os.getenv("WHATSAPP_BURST", "5")),
+)
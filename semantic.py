@@ -0,0 +1,153 @@
+import copy
+import re
+import zlib
+
+import numpy as np
+
+# Hashed feature space for the local TF-IDF embeddings
+DIM = 2**12
+
+# Field tags added to profile text so broad preferences ("someone in
+# healthcare", "a creative person") share terms with concrete professions
+FIELDS = {
+    "healthcare medical health": (
+        "doctor", "nurse", "dentist", "pharmacist", "physiotherapist",
+        "nutritionist", "therapist", "lab technician", "psychologist",
+        "counselor", "fitness",
+    ),
+    "creative arts design": (
+        "designer", "artist", "animator", "photographer", "creator",
+        "writer", "editor", "chef", "makeup",
+    ),
+    "technology tech computer it": (
+        "engineer", "developer", "data", "software", "cyber", "devops",
+        "network", "systems", "ai ", "seo",
+    ),
+    "business finance corporate": (
+        "accountant", "banker", "auditor", "economist", "manager",
+        "marketing", "marketer", "businessman", "hr ", "officer",
+    ),
+    "education academic teaching": (
+        "teacher", "lecturer", "professor", "librarian", "researcher",
+        "scientist", "mathematician", "statistician",
+    ),
+}
+
+STOPWORDS = {
+    "i", "a", "an", "the", "want", "someone", "partner", "who", "is", "in",
+    "from", "and", "or", "of", "me", "my", "than", "with", "person", "like",
+    "would", "prefer", "should", "be",
+}
+
+
+def fields_of(text):
+    lowered = f"{text.lower()} "
+    return [tag for tag, terms in FIELDS.items() if any(t in lowered for t in terms)]
+
+
+def _tagged(text):
+    return " ".join([text, *fields_of(text)])
+
+
+def profile_text(p):
+    return f"{_tagged(p.profession)} {p.education} {p.location}"
+
+
+# Words plus boundary-padded character trigrams, so "engineer" also
+# overlaps with "engineering" and typos still share most features
+def _features(text):
+    words = [w for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in STOPWORDS]
+    features = list(words)
+    for w in words:
+        padded = f" {w} "
+        features.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+    return features
+
+
+def _counts(texts):
+    counts = np.zeros((len(texts), DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for f in _features(text):
+            counts[row, zlib.crc32(f.encode()) % DIM] += 1
+    return counts
+
+
+def _normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+# In-process vector index over profile text. Profiles sharing the same
+# profession/education/location share one row, so the matrix grows with the
+# number of distinct texts rather than the number of profiles.
+class SemanticIndex:
+    # `idf` lets a shard weight terms as the whole dataset does, so scores
+    # from different shards stay comparable. `position` maps ids to positions
+    # in `profiles`; the catalog passes its own.
+    def __init__(self, profiles, idf=None, position=None):
+        texts = {}
+        rows = []
+        for p in profiles:
+            rows.append(texts.setdefault(profile_text(p), len(texts)))
+        if position is None:
+            position = {p.id: i for i, p in enumerate(profiles)}
+        self._position = position
+        self._texts = texts
+        self._rows = np.array(rows, dtype=np.int64)
+        counts = _counts(list(texts))
+        if idf is None:
+            # Document frequency counted over profiles, not distinct texts
+            df = np.bincount(self._rows, minlength=len(texts)) @ (counts > 0)
+            idf = (np.log((1 + len(rows)) / (1 + df)) + 1).astype(np.float32)
+        self.idf = idf
+        self.vectors = _normalize(counts * self.idf)
+
+    def embed(self, text):
+        return _normalize(_counts([_tagged(text)])[0] * self.idf)
+
+    # Cosine similarity of each of `profiles` to `text`
+    def scores(self, text, profiles):
+        return self.similarity(self.embed(text), profiles)
+
+    # Same, for an already embedded query
+    def similarity(self, query, profiles):
+        if not profiles or not query.any():
+            return np.zeros(len(profiles), dtype=np.float32)
+        positions = np.array([self._position[p.id] for p in profiles])
+        return (self.vectors @ query)[self._rows[positions]]
+
+    # Top `k` of `profiles` by cosine similarity to `text`, best first
+    def rank(self, text, profiles, k):
+        scores = self.scores(text, profiles)
+        if not scores.any():
+            return list(profiles[:k])
+        if len(profiles) > k:
+            top = np.argpartition(-scores, k)[:k]
+        else:
+            top = np.arange(len(profiles))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [profiles[i] for i in top]
+
+
+    # A copy with the profile at position `i` replaced, or appended, for
+    # single-profile catalog edits. Terms keep the weights of the last full
+    # build, as in a shard; a text not seen before adds one row.
+    def changed(self, i, profile):
+        index = copy.copy(self)
+        text = profile_text(profile)
+        row = self._texts.get(text)
+        if row is None:
+            row = len(self._texts)
+            index._texts = {**self._texts, text: row}
+            index.vectors = np.vstack([self.vectors, _normalize(_counts([text]) * self.idf)])
+        if i == len(self._rows):
+            index._rows = np.append(self._rows, row)
+        else:
+            index._rows = self._rows.copy()
+            index._rows[i] = row
+        return index
+
+
+# Index over the catalog's current profiles; see Catalog.semantic
+def index_for(catalog):
+    return catalog.semantic()
@@ -0,0 +1,92 @@
+import sys
+from multiprocessing.connection import Connection
+
+import numpy as np
+
+from semantic import SemanticIndex
+
+# Entry point of a shard process (see shards.py), started with one end of a
+# pipe. It imports only numpy, the vector index and the profile record; never
+# the catalog, the pipeline or the agents SDK, so a shard holds nothing but
+# its own slice and the index over it.
+
+# This shard's profiles by id, and the vector index over them
+profiles = {}
+index = None
+idf = None
+
+
+def _reindex():
+    global index
+    index = SemanticIndex(list(profiles.values()), idf)
+
+
+def load(shard_profiles, shared_idf):
+    global idf
+    idf = shared_idf
+    profiles.clear()
+    profiles.update((r.id, r) for r in shard_profiles)
+    _reindex()
+    return len(profiles)
+
+
+# Add a profile, or replace the one with its id
+def put(profile):
+    profiles[profile.id] = profile
+    _reindex()
+
+
+def remove(profile_id):
+    if profiles.pop(profile_id, None) is not None:
+        _reindex()
+
+
+# Filter, drop excluded ids and keep the best `k` by similarity to `vector`
+# (an embedded query), or all of them by age without one
+def query(gender, min_age, max_age, profession, exclude, vector, k):
+    profession = profession.strip().lower() if profession else None
+    found = sorted(
+        (
+            r
+            for r in profiles.values()
+            if r.gender == gender
+            and max(min_age, 0) <= r.age <= max_age
+            and r.id not in exclude
+            and (not profession or profession in r.profession.lower())
+        ),
+        key=lambda r: r.age,
+    )
+    if vector is None:
+        return [(0.0, r) for r in found]
+    scores = index.similarity(vector, found)
+    if k is not None and len(found) > k:
+        top = np.argpartition(-scores, k)[:k]
+    else:
+        top = np.arange(len(found))
+    return [(float(scores[i]), found[i]) for i in top]
+
+
+OPERATIONS = {"load": load, "put": put, "remove": remove, "query": query}
+
+
+def serve(conn):
+    while True:
+        try:
+            operation, args = conn.recv()
+        except (EOFError, OSError):
+            # The parent has gone away
+            return
+        if operation == "stop":
+            return
+        try:
+            result = (True, OPERATIONS[operation](*args))
+        except Exception as e:
+            result = (False, e)
+        try:
+            conn.send(result)
+        except OSError:
+            return
+
+
+if __name__ == "__main__":
+    serve(Connection(int(sys.argv[1])))
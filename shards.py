@@ -0,0 +1,214 @@
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+
+from dotenv import load_dotenv
+
+from semantic import index_for
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Hold each location's profiles in its own worker process and scatter
+# candidate queries to them
+SHARDED = os.getenv("SHARDED", "0") == "1"
+WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shard_worker.py")
+
+
+# One shard process, run as a plain script (shard_worker.py) rather than a
+# multiprocessing child, which would re-import the parent's __main__ and,
+# through it, the catalog and the agent stack. Calls go over a pipe, one at a
+# time.
+class Shard:
+    def __init__(self, profiles, idf):
+        conn, child = multiprocessing.Pipe()
+        self.process = subprocess.Popen(
+            [sys.executable, WORKER, str(child.fileno())], pass_fds=[child.fileno()]
+        )
+        child.close()
+        self._conn = conn
+        self._lock = threading.Lock()
+        self.call("load", profiles, idf)
+
+    def call(self, operation, *args):
+        with self._lock:
+            self._conn.send((operation, args))
+            ok, value = self._conn.recv()
+        if not ok:
+            raise value
+        return value
+
+    # Waits for the call in flight, if any, before stopping the process
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.send(("stop", ()))
+            except OSError:
+                pass
+            self._conn.close()
+        try:
+            self.process.wait(5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+# One shard per location. Queries go to the shard of the requested location,
+# or to all shards, and the partial results are merged: by similarity when
+# there is a query, otherwise by age as the catalog does. Single-profile
+# catalog changes are sent to the shards they affect.
+class ShardedCatalog:
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.version = catalog.version
+        index = index_for(catalog)
+        # The query is embedded with the IDF the shards were given
+        self._embed = index.embed
+        self._idf = index.idf
+        self._location = {}
+        by_location = {}
+        for r in catalog.profiles:
+            by_location.setdefault(r.location.lower(), []).append(r)
+            self._location[r.id] = r.location.lower()
+        self.shards = {location: Shard(profiles, self._idf) for location, profiles in by_location.items()}
+        self._active = 0
+        self._idle = threading.Condition()
+        self.closed = False
+
+    def _for(self, location=None):
+        if location is None:
+            return list(self.shards.values())
+        shard = self.shards.get(location.strip().lower())
+        return [shard] if shard else []
+
+    # Bring the shards up to the catalog's version from its change log; False
+    # when the log does not reach back that far (a swapped dataset)
+    def apply(self, catalog):
+        version = catalog.version
+        changes = catalog.changes_since(self.version)
+        if changes is None:
+            return False
+        for profile in changes:
+            location = profile.location.lower()
+            previous = self._location.get(profile.id)
+            if previous is not None and previous != location:
+                self.shards[previous].call("remove", profile.id)
+            if location in self.shards:
+                self.shards[location].call("put", profile)
+            else:
+                self.shards[location] = Shard([profile], self._idf)
+            self._location[profile.id] = location
+        self.version = version
+        return True
+
+    async def search(
+        self,
+        gender,
+        min_age,
+        max_age,
+        profession=None,
+        location=None,
+        exclude=frozenset(),
+        query=None,
+        k=None,
+    ):
+        with self._idle:
+            closed = self.closed
+            if not closed:
+                self._active += 1
+        if closed:
+            # Replaced while this request was on its way here
+            return await (await shards_for(self.catalog)).search(
+                gender, min_age, max_age, profession, location, exclude, query, k
+            )
+        try:
+            vector = self._embed(query) if query else None
+            if vector is not None and not vector.any():
+                vector = None
+            parts = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        shard.call, "query", gender, min_age, max_age, profession, exclude, vector, k
+                    )
+                    for shard in self._for(location)
+                )
+            )
+        finally:
+            with self._idle:
+                self._active -= 1
+                self._idle.notify_all()
+        found = [hit for part in parts for hit in part]
+        if vector is None:
+            found.sort(key=lambda hit: (hit[1].age, hit[1].id))
+        else:
+            found.sort(key=lambda hit: (-hit[0], hit[1].id))
+        if k is not None:
+            found = found[:k]
+        # Shards still running on a dataset that has since been swapped out
+        # can return ids the catalog no longer has; current profiles only
+        current = (self.catalog.get(r.id) for _, r in found)
+        return [r for r in current if r is not None]
+
+    # Let searches already running finish, then stop the processes
+    def close(self):
+        with self._idle:
+            self.closed = True
+            self._idle.wait_for(lambda: self._active == 0, timeout=60)
+        for shard in self.shards.values():
+            shard.close()
+
+
+_sharded = None
+_rebuilding = False
+_sharded_lock = threading.Lock()
+
+
+def _rebuild(catalog):
+    global _sharded, _rebuilding
+    try:
+        fresh = ShardedCatalog(catalog)
+    except Exception:
+        logger.exception("could not rebuild the shards")
+        fresh = None
+    with _sharded_lock:
+        old = _sharded
+        if fresh is not None:
+            _sharded = fresh
+        _rebuilding = False
+    if fresh is not None and old is not None:
+        old.close()
+
+
+# Runs off the event loop: starts the shards the first time, applies
+# single-profile changes, and after a dataset swap starts replacement shards
+# in the background while the current ones keep answering
+def _current(catalog):
+    global _sharded, _rebuilding
+    with _sharded_lock:
+        if _sharded is None:
+            _sharded = ShardedCatalog(catalog)
+        elif _sharded.version != catalog.version and not _rebuilding:
+            if not _sharded.apply(catalog):
+                _rebuilding = True
+                threading.Thread(
+                    target=_rebuild, args=(catalog,), name="shards-rebuild", daemon=True
+                ).start()
+        return _sharded
+
+
+# Shards over the catalog's current profiles
+async def shards_for(catalog):
+    sharded = _sharded
+    if sharded is not None and (sharded.version == catalog.version or _rebuilding):
+        return sharded
+    return await asyncio.to_thread(_current, catalog)
+
+
+@atexit.register
+def _shutdown():
+    if _sharded is not None:
+        _sharded.close()
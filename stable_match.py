@@ -0,0 +1,278 @@
+import argparse
+import csv
+import os
+import random
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from catalog import catalog
+from semantic import FIELDS, fields_of
+
+FIELD_CODES = {tag: code for code, tag in enumerate(FIELDS)}
+
+
+def education_level(education):
+    e = education.lower()
+    if e.startswith("phd"):
+        return 4
+    if re.match(r"(ms|msc|ma|mba|mphil|mlis|m\.ed)\b", e) or e in {
+        "mbbs", "pharmd", "ca", "acca", "css",
+    }:
+        return 3
+    if e.startswith("b") or e in {"dpt", "llb", "mass comm", "fine arts"}:
+        return 2
+    return 1
+
+
+# Matching only looks at these attributes, so profiles that agree on all of
+# them are interchangeable "types". Scores are computed per type pair, which
+# keeps the score matrix proportional to distinct types, not profiles.
+def encode(profiles):
+    locations = {}
+    field_codes = {}
+    levels = {}
+    rows = []
+    for p in profiles:
+        if p.profession not in field_codes:
+            fields = fields_of(p.profession)
+            field_codes[p.profession] = FIELD_CODES[fields[0]] if fields else -1
+        if p.education not in levels:
+            levels[p.education] = education_level(p.education)
+        rows.append(
+            (
+                p.age,
+                locations.setdefault(p.location, len(locations)),
+                field_codes[p.profession],
+                levels[p.education],
+            )
+        )
+    return np.array(rows, dtype=np.int16).reshape(-1, 4)
+
+
+# How much the viewer wants the other: age closeness, same city, same broad
+# field, and an equally or more educated partner, which makes the score
+# directional. Works on any broadcastable feature arrays.
+def score(v, o):
+    age_gap = np.abs(v[..., 0] - o[..., 0]).astype(np.float32)
+    total = 2 * np.maximum(0, 1 - age_gap / 6)
+    total += v[..., 1] == o[..., 1]
+    total += (v[..., 2] == o[..., 2]) & (v[..., 2] >= 0)
+    total += 0.5 * (o[..., 3] >= v[..., 3])
+    return total
+
+
+# Scores of each viewer type (rows) for each other type (columns)
+def score_block(viewers, others):
+    return score(viewers[:, None, :], others[None, :, :])
+
+
+def _blocks(n, size):
+    return [(start, min(start + size, n)) for start in range(0, n, size)]
+
+
+# Worker state for process-pool scoring, set once per process
+_shared = {}
+
+
+def _init(state):
+    _shared.update(state)
+
+
+# Continue a proposer type's preference list: women types in `order` (best
+# score first, ties by type index) from type position `pos`, member `offset`,
+# expanded into member profiles until `want` more are picked or the scores
+# drop under `min_score`. Returns the picks and where to resume.
+def _expand(row, order, pos, offset, want, members, min_score):
+    picked = []
+    while pos < len(order) and len(picked) < want:
+        other = order[pos]
+        if row[other] < min_score:
+            pos = len(order)
+            break
+        chunk = members[other][offset : offset + want - len(picked)]
+        picked.extend(chunk)
+        offset += len(chunk)
+        if offset == len(members[other]):
+            pos, offset = pos + 1, 0
+    return picked, pos, offset
+
+
+# First part of the preference lists for a block of proposer types: `k`
+# spares beyond the proposer type's own size. The rest is expanded on
+# demand during the round (see stable_match).
+def _preference_block(bounds):
+    start, stop = bounds
+    s = _shared
+    scores = score_block(s["proposer_types"][start:stop], s["receiver_types"])
+    lists = []
+    for row, t in zip(scores, range(start, stop)):
+        order = np.argsort(-row, kind="stable")
+        want = s["k"] + s["proposer_sizes"][t]
+        lists.append(_expand(row, order, 0, 0, want, s["receiver_members"], s["min_score"]))
+    return lists
+
+
+def _score_matrix_block(bounds):
+    start, stop = bounds
+    return score_block(_shared["receiver_types"][start:stop], _shared["proposer_types"])
+
+
+def _group(features):
+    types, inverse, sizes = np.unique(
+        features, axis=0, return_inverse=True, return_counts=True
+    )
+    inverse = inverse.reshape(-1)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(sizes)[:-1]
+    members = [chunk.tolist() for chunk in np.split(order, bounds)]
+    return types, inverse, sizes, members
+
+
+def _map(fn, blocks, state, workers):
+    if workers > 1:
+        with ProcessPoolExecutor(workers, initializer=_init, initargs=(state,)) as pool:
+            return list(pool.map(fn, blocks))
+    _init(state)
+    try:
+        return [fn(b) for b in blocks]
+    finally:
+        _shared.clear()
+
+
+# Men-proposing Gale-Shapley over the whole population. Men's lists start
+# with their best `k` spare candidates (see _preference_block) and are
+# extended, doubling each time, whenever a man type runs out of them, so the
+# round sees every acceptable woman in order of preference. Women judge any
+# proposal by their own score of the proposer. The result is stable against
+# the full preferences: no man and woman both strictly prefer each other to
+# their outcome. Pairs under `min_score` are never formed.
+def stable_match(men, women, k=20, block=256, workers=1, min_score=2.0):
+    m_types, m_inverse, m_sizes, _ = _group(encode(men))
+    w_types, w_inverse, _, w_members = _group(encode(women))
+    state = {
+        "proposer_types": m_types,
+        "proposer_sizes": m_sizes.tolist(),
+        "receiver_types": w_types,
+        "receiver_members": w_members,
+        "k": k,
+        "min_score": min_score,
+    }
+    lists = []
+    resume = []
+    for part in _map(_preference_block, _blocks(len(m_types), block), state, workers):
+        for picked, pos, offset in part:
+            lists.append(picked)
+            resume.append((pos, offset))
+    women_scores = np.concatenate(
+        _map(_score_matrix_block, _blocks(len(w_types), block), state, workers)
+    )
+
+    # Each woman's score of the men proposing from a list, looked up once per
+    # list instead of once per proposal
+    list_scores = [
+        women_scores[w_inverse[choices], t].tolist() if choices else []
+        for t, choices in enumerate(lists)
+    ]
+
+    # Append the next stretch of type t's list; False when nothing is left
+    def extend(t):
+        pos, offset = resume[t]
+        if pos >= len(w_types):
+            return False
+        row = score_block(m_types[t : t + 1], w_types)[0]
+        order = np.argsort(-row, kind="stable")
+        want = max(len(lists[t]), k + int(m_sizes[t]))
+        picked, pos, offset = _expand(row, order, pos, offset, want, w_members, min_score)
+        resume[t] = (pos, offset)
+        if not picked:
+            return False
+        lists[t].extend(picked)
+        list_scores[t].extend(women_scores[w_inverse[picked], t].tolist())
+        return True
+
+    m_type = m_inverse.tolist()
+    cursor = [0] * len(lists)
+    partner = [-1] * len(women)
+    partner_score = [0.0] * len(women)
+    free = deque(range(len(men)))
+    while free:
+        m = free.popleft()
+        t = m_type[m]
+        choices = lists[t]
+        offers = list_scores[t]
+        i = cursor[t]
+        end = len(choices)
+        while True:
+            if i == end:
+                if not extend(t):
+                    break
+                end = len(choices)
+            w = choices[i]
+            if offers[i] >= min_score and (partner[w] == -1 or offers[i] > partner_score[w]):
+                break
+            i += 1
+        if i == end:
+            cursor[t] = i
+            continue
+        cursor[t] = i + 1
+        if partner[w] != -1:
+            free.append(partner[w])
+        partner[w] = m
+        partner_score[w] = offers[i]
+
+    matched = [w for w, m in enumerate(partner) if m != -1]
+    husbands = [partner[w] for w in matched]
+    men_scores = score(m_types[m_inverse[husbands]], w_types[w_inverse[matched]])
+    return [
+        (men[m], women[w], men_score, partner_score[w])
+        for m, w, men_score in zip(husbands, matched, men_scores.tolist())
+    ]
+
+
+# Synthetic population for scale runs: catalogue profiles with jittered ages
+def synthetic(profiles, n, seed=0):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        p = rng.choice(profiles)
+        out.append(p.replace(id=i + 1, age=max(18, p.age + rng.randint(-5, 5))))
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Pair the whole population with a stable matching round"
+    )
+    parser.add_argument("--synthetic", type=int, help="profiles per side to generate instead of the catalogue")
+    parser.add_argument("-k", type=int, default=20, help="spare candidates in each first preference list")
+    parser.add_argument("--block", type=int, default=256, help="types per score block")
+    parser.add_argument("--workers", type=int, default=1, help="processes for scoring blocks (0 = all cores)")
+    parser.add_argument("--min-score", type=float, default=2.0)
+    parser.add_argument("--out", help="write pairs to this CSV file")
+    args = parser.parse_args()
+
+    men = [p for p in catalog.profiles if p.gender == "Male"]
+    women = [p for p in catalog.profiles if p.gender == "Female"]
+    if args.synthetic:
+        men = synthetic(men, args.synthetic, seed=1)
+        women = synthetic(women, args.synthetic, seed=2)
+    workers = args.workers or os.cpu_count()
+
+    started = time.perf_counter()
+    pairs = stable_match(men, women, args.k, args.block, workers, args.min_score)
+    elapsed = time.perf_counter() - started
+    print(f"{len(men):,} men x {len(women):,} women -> {len(pairs):,} pairs in {elapsed:.1f}s")
+
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["man_id", "woman_id", "man_score", "woman_score"])
+            for m, w, man_score, woman_score in pairs:
+                writer.writerow([m.id, w.id, f"{man_score:.2f}", f"{woman_score:.2f}"])
+    else:
+        for m, w, man_score, woman_score in pairs[:20]:
+            print(f"{m.name} ({m.age}, {m.profession}, {m.location}) <-> {w.name} ({w.age}, {w.profession}, {w.location})  {man_score:.2f}/{woman_score:.2f}")
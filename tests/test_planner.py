@@ -0,0 +1,47 @@
+import unittest
+
+from bitmaps import BitmapIndex
+from planner import predicates_for
+from profiles import Profile
+
+PROFILES = [
+    Profile(1, "Ayesha", 27, "Female", "Doctor", "MBBS", "Lahore"),
+    Profile(2, "Sana", 29, "Female", "Engineer", "BSc", "Karachi"),
+    Profile(3, "Hira", 30, "Female", "Lawyer", "LLB", "Islamabad"),
+    Profile(4, "Ali", 28, "Male", "Teacher", "MA", "Lahore"),
+]
+
+
+def criteria(prompt):
+    user = {"gender": "Male", "age": 28, "custom_prompt": prompt}
+    predicates = predicates_for(user, frozenset(), BitmapIndex(PROFILES))
+    return {p.field: p.values for p in predicates if p.source == "prompt"}
+
+
+class PredicatesForTest(unittest.TestCase):
+    def test_plain_mentions(self):
+        found = criteria("a doctor from Lahore")
+        self.assertEqual(found["location"], ["lahore"])
+        self.assertEqual(found["profession"], ["doctor"])
+
+    def test_negated_mentions_are_dropped(self):
+        for prompt in ("not a doctor", "no doctors please", "anything but a doctor", "without a doctor"):
+            with self.subTest(prompt=prompt):
+                self.assertNotIn("profession", criteria(prompt))
+        self.assertNotIn("location", criteria("someone other than Lahore"))
+
+    def test_than_is_not_a_negation(self):
+        found = criteria("someone older than me from Lahore")
+        self.assertEqual(found["location"], ["lahore"])
+        self.assertEqual(found["age"], [29, 30, 31, 32])
+
+    def test_but_ends_the_negation(self):
+        self.assertEqual(criteria("not a doctor but an engineer")["profession"], ["engineer"])
+
+    def test_negation_stops_at_the_clause(self):
+        self.assertEqual(criteria("a doctor, not from Karachi")["profession"], ["doctor"])
+        self.assertNotIn("location", criteria("a doctor, not from Karachi"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+from catalog import catalog
+from stable_match import encode, score_block, stable_match, synthetic
+
+MIN_SCORE = 2.0
+
+
+def population(n):
+    men = synthetic([p for p in catalog.profiles if p.gender == "Male"], n, seed=1)
+    women = synthetic([p for p in catalog.profiles if p.gender == "Female"], n, seed=2)
+    return men, women
+
+
+# Pairs (m, w) who both score each other at least MIN_SCORE and would both
+# rather be together than with their partners (or alone)
+def blocking_pairs(men, women, pairs):
+    men_scores = score_block(encode(men), encode(women))
+    women_scores = score_block(encode(women), encode(men))
+    man_index = {p.id: i for i, p in enumerate(men)}
+    woman_index = {p.id: i for i, p in enumerate(women)}
+    wife = {man_index[m.id]: woman_index[w.id] for m, w, _, _ in pairs}
+    husband = {w: m for m, w in wife.items()}
+    found = []
+    for m in range(len(men)):
+        for w in range(len(women)):
+            if men_scores[m, w] < MIN_SCORE or women_scores[w, m] < MIN_SCORE:
+                continue
+            man_wants = m not in wife or men_scores[m, w] > men_scores[m, wife[m]]
+            woman_wants = w not in husband or women_scores[w, m] > women_scores[w, husband[w]]
+            if man_wants and woman_wants:
+                found.append((m, w))
+    return found
+
+
+class StableMatchTest(unittest.TestCase):
+    def test_pairs_are_valid(self):
+        men, women = population(400)
+        pairs = stable_match(men, women, min_score=MIN_SCORE)
+        self.assertTrue(pairs)
+        self.assertEqual(len({m.id for m, _, _, _ in pairs}), len(pairs))
+        self.assertEqual(len({w.id for _, w, _, _ in pairs}), len(pairs))
+        for _, _, man_score, woman_score in pairs:
+            self.assertGreaterEqual(man_score, MIN_SCORE)
+            self.assertGreaterEqual(woman_score, MIN_SCORE)
+
+    def test_globally_stable(self):
+        men, women = population(400)
+        for k in (0, 5, 20):
+            with self.subTest(k=k):
+                pairs = stable_match(men, women, k=k, min_score=MIN_SCORE)
+                self.assertEqual(blocking_pairs(men, women, pairs), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import os
+import time
+
+from dotenv import load_dotenv
+
+from bitmaps import bitmaps_for
+from catalog import catalog
+from local_match import local_match
+from pipeline import (
+    MODEL_NAME,
+    WHATSAPP_BASE_URL,
+    external_agent,
+    instance,
+    whatsapp_session,
+)
+from planner import AGE_SPREAD
+from ratelimit import model_limiter
+from semantic import index_for
+from shards import SHARDED, shards_for
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Also send a one-token model request, so the first user doesn't pay for
+# the provider's cold path either (costs one request of the model quota)
+WARMUP_PRIME_MODEL = os.getenv("WARMUP_PRIME_MODEL", "0") == "1"
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "10"))
+
+# Per-step outcome of the warm-up, and whether it has finished
+report = {}
+ready = False
+
+
+def _build_indexes():
+    bitmaps_for(catalog)
+    index_for(catalog)
+    catalog.prefill_windows(AGE_SPREAD)
+    # One local match per gender runs the scoring path once end to end
+    for gender in ("Male", "Female"):
+        candidates, _ = catalog.window(gender, 28, 4)
+        user = {"age": 28, "profession": "Engineer", "location": "Lahore", "custom_prompt": ""}
+        local_match(user, candidates)
+
+
+async def _open_gemini():
+    await external_agent.models.list()
+
+
+def _open_ultramsg():
+    # Any answer will do; this is only for the TLS handshake and the pool
+    whatsapp_session.head(f"{WHATSAPP_BASE_URL}/{instance}/", timeout=WARMUP_TIMEOUT)
+
+
+# Starts every shard process and loads its profiles
+async def _start_shards():
+    sharded = await shards_for(catalog)
+    await sharded.search("Female", 18, 18, query="warm up", k=1)
+
+
+async def _prime_model():
+    await model_limiter.acquire_async()
+    await external_agent.chat.completions.create(
+        model=MODEL_NAME,
+        messages=[{"role": "user", "content": "Reply with OK."}],
+        max_tokens=1,
+    )
+
+
+# `timeout` bounds the network steps; local ones (None) run to completion
+async def _step(name, work, timeout=WARMUP_TIMEOUT):
+    started = time.monotonic()
+    try:
+        await asyncio.wait_for(work, timeout)
+    except Exception as e:
+        # A service that is down now is the breakers' business later; the
+        # process still comes up
+        logger.warning("warm-up step %s failed: %s", name, e)
+        report[name] = {"ok": False, "seconds": round(time.monotonic() - started, 3), "error": str(e)}
+    else:
+        report[name] = {"ok": True, "seconds": round(time.monotonic() - started, 3)}
+
+
+# Run once per process before it takes traffic, on the event loop that will
+# serve requests (pooled async connections belong to their loop)
+async def warm_up():
+    global ready
+    steps = [
+        _step("indexes", asyncio.to_thread(_build_indexes), timeout=None),
+        _step("gemini_connection", _open_gemini()),
+        _step("ultramsg_connection", asyncio.to_thread(_open_ultramsg)),
+    ]
+    if SHARDED:
+        steps.append(_step("shards", _start_shards(), timeout=None))
+    if WARMUP_PRIME_MODEL:
+        steps.append(_step("model_priming", _prime_model()))
+    await asyncio.gather(*steps)
+    # Unreachable services are tolerated, but not a process without its indexes
+    ready = report["indexes"]["ok"] and report.get("shards", {"ok": True})["ok"]
+    logger.info("warm-up done: %s", report)
+    return report
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import os
+
+from dotenv import load_dotenv
+
+from deadline import Deadline, DeadlineExceeded
+from jobs import jobs
+from pipeline import main
+from profiling import profiled
+from ratelimit import RateLimitExceeded
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+# Matching jobs run on a fixed number of worker tasks per process, so
+# throughput is set here and not by how many clients are connected
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "8"))
+# Jobs that may wait for a worker; submissions beyond that are rejected
+JOB_QUEUE = int(os.getenv("JOB_QUEUE", "100"))
+# How often the pool touches its queued jobs and prunes the job store
+JOB_HOUSEKEEPING = 10
+
+
+async def run_job(job_id, user_data, deadline):
+    jobs.update(job_id, "matching")
+    try:
+        outcome = await profiled(
+            job_id, main(user_data, deadline, on_stage=lambda status: jobs.update(job_id, status))
+        )
+    except RateLimitExceeded as e:
+        jobs.update(job_id, "rejected", error=str(e))
+    except DeadlineExceeded as e:
+        jobs.update(job_id, "timeout", error=str(e))
+    except Exception as e:
+        logger.exception("Match job %s failed", job_id)
+        jobs.update(job_id, "failed", error=str(e))
+    else:
+        jobs.update(job_id, "done", result=outcome.as_json())
+
+
+# Queue plus worker tasks on one event loop. A job submitted with a deadline
+# (a caller waiting on it) has been running against it since submission;
+# one without gets the full MATCH_DEADLINE once a worker picks it up.
+class JobPool:
+    def __init__(self, size=JOB_WORKERS, backlog=JOB_QUEUE):
+        self.size = size
+        self.backlog = backlog
+        self._loop = None
+        self._queue = None
+        self._workers = []
+        self._finished = {}
+        self._queued = set()
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(self.backlog)
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"match-worker-{i}") for i in range(self.size)
+        ]
+        self._workers.append(asyncio.create_task(self._housekeeping(), name="match-housekeeping"))
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    @property
+    def queued(self):
+        return self._queue.qsize() if self._queue else 0
+
+    async def _housekeeping(self):
+        while True:
+            try:
+                jobs.touch(list(self._queued))
+                jobs.prune()
+            except Exception:
+                logger.exception("job housekeeping failed")
+            await asyncio.sleep(JOB_HOUSEKEEPING)
+
+    async def _work(self):
+        while True:
+            job_id, user_data, deadline = await self._queue.get()
+            self._queued.discard(job_id)
+            try:
+                await run_job(job_id, user_data, deadline or Deadline())
+            finally:
+                self._queue.task_done()
+                finished = self._finished.pop(job_id, None)
+                if finished is not None and not finished.done():
+                    finished.set_result(None)
+
+    # Record the job and queue it; called on the pool's loop
+    def submit(self, user_data, deadline=None):
+        if self._queue.full():
+            raise RateLimitExceeded("matching")
+        job_id = jobs.create(user_data)
+        self._finished[job_id] = self._loop.create_future()
+        self._queued.add(job_id)
+        self._queue.put_nowait((job_id, user_data, deadline))
+        return job_id
+
+    # The same from another thread, such as a Streamlit script run
+    def submit_threadsafe(self, user_data, deadline=None):
+        async def submit():
+            return self.submit(user_data, deadline)
+
+        return asyncio.run_coroutine_threadsafe(submit(), self._loop).result()
+
+    # Until the job has finished; a caller that gives up does not cancel it
+    async def wait(self, job_id):
+        finished = self._finished.get(job_id)
+        if finished is not None:
+            await asyncio.shield(finished)